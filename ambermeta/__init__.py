@@ -11,14 +11,22 @@ from ambermeta.protocol import (
     load_protocol_from_manifest,
 )
 
-# TUI is optional - only available if textual is installed
-try:
-    from ambermeta.tui import run_tui, ProtocolState, Stage, TEXTUAL_AVAILABLE
-except ImportError:
-    run_tui = None
-    ProtocolState = None
-    Stage = None
-    TEXTUAL_AVAILABLE = False
+# TUI is optional - only available if textual is installed. Its exports are
+# resolved on first access so importing the package does not load textual.
+_TUI_EXPORTS = ("run_tui", "ProtocolState", "Stage", "TEXTUAL_AVAILABLE")
+
+
+def __getattr__(name):
+    if name not in _TUI_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        from ambermeta import tui
+    except ImportError:
+        value = False if name == "TEXTUAL_AVAILABLE" else None
+    else:
+        value = getattr(tui, name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     "SimulationProtocol",
@@ -5,6 +5,7 @@ import json
 import os
 import statistics
 import sys
+from dataclasses import fields, is_dataclass
 from typing import Any, Dict, Iterable, List, Optional
 
 from ambermeta.logging_config import configure_logging, get_logger
@@ -546,7 +547,12 @@ def _info_command(args: argparse.Namespace) -> int:
             print("=" * 60)
 
             if details:
-                for key, value in vars(details).items():
+                # Slotted dataclasses have no __dict__, so walk their fields
+                if is_dataclass(details):
+                    items = [(f.name, getattr(details, f.name)) for f in fields(details)]
+                else:
+                    items = list(vars(details).items())
+                for key, value in items:
                     if key.startswith("_"):
                         continue
                     if isinstance(value, (list, dict)) and not value:
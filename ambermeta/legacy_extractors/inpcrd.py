@@ -5,9 +5,12 @@ import sys
 import math
 import glob
 import struct
+import functools
 from dataclasses import dataclass, field
 from typing import Optional, List, Union, Tuple
 
+from ambermeta.utils import _DATACLASS_SLOTS
+
 # -------------------------------
 # 1. Dependency Management
 # -------------------------------
@@ -29,11 +32,23 @@ except ImportError:
     except ImportError:
         pass
 
+# Resolve the backend once so parsers call the opener directly
+if NETCDF_BACKEND == "netCDF4":
+    def _open_netcdf(filepath: str):
+        return nc.Dataset(filepath, 'r')
+elif NETCDF_BACKEND == "scipy":
+    def _open_netcdf(filepath: str):
+        # No mmap: arrays read from the file are still referenced at close(),
+        # which scipy refuses for memory-mapped files
+        return nc.netcdf_file(filepath, 'r', mmap=False)
+else:
+    _open_netcdf = None
+
 # -------------------------------
 # 2. Metadata Dataclass
 # -------------------------------
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class InpcrdMetadata:
     """
     Represents metadata extracted from an AMBER inpcrd/restrt file.
@@ -82,26 +97,38 @@ def _calc_volume(lengths: List[float], angles: List[float]) -> float:
     angles: [alpha, beta, gamma] (in degrees)
     """
     a, b, c = lengths
-    alpha, beta, gamma = [math.radians(x) for x in angles]
-    
-    term = 1 - math.cos(alpha)**2 - math.cos(beta)**2 - math.cos(gamma)**2 + \
-           2 * math.cos(alpha) * math.cos(beta) * math.cos(gamma)
+    alpha, beta, gamma = angles
+    ca = math.cos(math.radians(alpha))
+    cb = math.cos(math.radians(beta))
+    cg = math.cos(math.radians(gamma))
+
+    term = 1 - ca * ca - cb * cb - cg * cg + 2 * ca * cb * cg
     
     if term < 0:
         return 0.0 # Should not happen in valid physical simulations
         
     return a * b * c * math.sqrt(term)
 
+@functools.lru_cache(maxsize=4096)
+def _detect_format_cached(filepath: str, inode: int, mtime_ns: int, size: int) -> str:
+    # Raw fd read: no buffered file object is needed for four bytes
+    fd = os.open(filepath, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        header = os.read(fd, 4)
+    finally:
+        os.close(fd)
+    if header.startswith(b'CDF'):
+        return "NetCDF"
+    return "ASCII"
+
 def _detect_format(filepath: str) -> str:
     """
     Reads the first 4 bytes to determine if file is NetCDF or ASCII.
     NetCDF files start with 'CDF' (ASCII bytes 67 68 70).
+    Results are cached per (path, inode, mtime, size), so unchanged files are not re-read.
     """
-    with open(filepath, 'rb') as f:
-        header = f.read(4)
-        if header.startswith(b'CDF'):
-            return "NetCDF"
-    return "ASCII"
+    st = os.stat(filepath)
+    return _detect_format_cached(filepath, st.st_ino, st.st_mtime_ns, st.st_size)
 
 # -------------------------------
 # 4. ASCII Parser
@@ -237,10 +264,7 @@ def _parse_netcdf_inpcrd(filepath: str) -> InpcrdMetadata:
 
     try:
         # Use a context manager if available (scipy.io.netcdf supports it, netCDF4 supports it)
-        if NETCDF_BACKEND == "netCDF4":
-            ds = nc.Dataset(filepath, 'r')
-        else:
-            ds = nc.netcdf_file(filepath, 'r', mmap=False)
+        ds = _open_netcdf(filepath)
 
         try:
             # Global Attributes
@@ -2,16 +2,22 @@ from __future__ import annotations
 
 import os
 import glob
+import json
+import fnmatch
 import math
+import functools
 import importlib.util
+import threading
 from typing import List, Optional, Sequence, Dict, Tuple
 
+from ambermeta.utils import _DATACLASS_SLOTS
+
 _numpy_spec = importlib.util.find_spec("numpy")
 if _numpy_spec is not None:  # pragma: no cover - optional dependency
     import numpy as np  # type: ignore
 else:  # pragma: no cover - optional dependency
     np = None  # type: ignore
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, fields
 
 # -------------------------------
 # 1. Dependency Management
@@ -31,11 +37,36 @@ except ImportError:
     except ImportError:
         pass
 
+# Resolve the backend once so parsers call the opener directly
+if NETCDF_BACKEND == "netCDF4":
+    def _open_netcdf(filepath: str):
+        ds = nc.Dataset(filepath, 'r')
+        # AMBER trajectories carry no fill values or packing attributes; plain
+        # ndarrays skip the numpy.ma wrapping and fill-value scan on every read
+        ds.set_auto_mask(False)
+        ds.set_auto_scale(False)
+        return ds
+
+    def _dim_size(dim) -> int:
+        return dim.size
+elif NETCDF_BACKEND == "scipy":
+    def _open_netcdf(filepath: str):
+        # No mmap: arrays read from the file are still referenced at close(),
+        # which scipy refuses for memory-mapped files
+        return nc.netcdf_file(filepath, 'r', mmap=False)
+
+    def _dim_size(dim) -> int:
+        # scipy maps dimension names straight to their lengths
+        return dim if isinstance(dim, int) else len(dim)
+else:
+    _open_netcdf = None
+    _dim_size = None
+
 # -------------------------------
 # 2. Metadata Dataclass
 # -------------------------------
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TrajectoryMetadata:
     filename: str
     file_format: str = "Unknown"  # NetCDF or ASCII
@@ -75,68 +106,182 @@ class TrajectoryMetadata:
     
     warnings: List[str] = field(default_factory=list)
 
+    def __reduce__(self):
+        # Pickled as positional field values (no per-field names or slot state):
+        # this is what --jobs workers send back, one object per file
+        return (self.__class__, tuple(getattr(self, name) for name in _TRAJECTORY_FIELDS))
+
+_TRAJECTORY_FIELDS = tuple(f.name for f in fields(TrajectoryMetadata))
+
 # -------------------------------
 # 3. Physics Helpers
 # -------------------------------
 
-def _calc_volume_array(lengths: np.ndarray, angles: Optional[np.ndarray]) -> np.ndarray:
+def _calc_volume_array(lengths: np.ndarray, angles: Optional[np.ndarray],
+                       work: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Calculate volumes for an array of box dimensions.
     lengths: (N, 3) array of a,b,c
     angles: (N, 3) array of alpha, beta, gamma (degrees)
+    work: optional float64 scratch of shape (4, >=N); the result is then a view into it
     """
     if np is None:
         raise ImportError("NumPy is required to calculate volume arrays")
 
+    n = lengths.shape[0]
+    if work is None:
+        work = np.empty((4, n))
+    ca, cb, cg, term = work[:, :n]
     if angles is None:
-        # Orthogonal: V = a*b*c
-        return np.prod(lengths, axis=1)
+        # Orthogonal: V = a*b*c, multiplied column-wise (several times faster than
+        # np.prod(axis=1), which reduces over the short, strided frame rows)
+        np.multiply(lengths[:, 0], lengths[:, 1], out=term, dtype=np.float64)
+        term *= lengths[:, 2]
+        return term
     
     # Triclinic
-    a = lengths[:, 0]
-    b = lengths[:, 1]
-    c = lengths[:, 2]
-    
-    # Convert degrees to radians
-    rads = np.radians(angles)
-    alpha = rads[:, 0]
-    beta  = rads[:, 1]
-    gamma = rads[:, 2]
-    
     # Formula: V = abc * sqrt(1 - cos^2(a) - cos^2(b) - cos^2(g) + 2cos(a)cos(b)cos(g))
-    ca = np.cos(alpha)
-    cb = np.cos(beta)
-    cg = np.cos(gamma)
-    
-    term = 1.0 - ca**2 - cb**2 - cg**2 + 2.0*ca*cb*cg
+    # Evaluated column by column in place: four (N,) rows instead of ~15 temporaries
+    if n > 0 and (angles == angles[0]).all():
+        # Fixed cell shape (the usual NPT case): the angle factor is one scalar
+        c1, c2, c3 = (math.cos(math.radians(float(x))) for x in angles[0])
+        f = 1 - c1 * c1 - c2 * c2 - c3 * c3 + 2 * c1 * c2 * c3
+        np.multiply(lengths[:, 0], math.sqrt(max(f, 0.0)), out=term, dtype=np.float64)
+        term *= lengths[:, 1]
+        term *= lengths[:, 2]
+        return term
+
+    for i, col in enumerate((ca, cb, cg)):
+        np.radians(angles[:, i], out=col, dtype=np.float64)
+        np.cos(col, out=col)
+
+    np.multiply(ca, cb, out=term)
+    term *= cg
+    term *= 2.0
+    term += 1.0
+    ca *= ca
+    cb *= cb
+    cg *= cg
+    term -= ca
+    term -= cb
+    term -= cg
     # Clamp term to 0 to avoid numerical sqrt errors for flat cells
-    term = np.maximum(term, 0.0)
-    
-    return a * b * c * np.sqrt(term)
+    np.maximum(term, 0.0, out=term)
+    np.sqrt(term, out=term)
 
-def _get_nc_attr(obj, attr_name: str, default: str = "Unknown") -> str:
-    if not hasattr(obj, attr_name):
-        return default
-    val = getattr(obj, attr_name)
-    if isinstance(val, bytes):
-        return val.decode('utf-8', errors='ignore')
-    return str(val)
+    term *= lengths[:, 0]
+    term *= lengths[:, 1]
+    term *= lengths[:, 2]
+    return term
 
-def _detect_format(filepath: str) -> str:
+# Per-thread scratch for _calc_volume_array, reused across chunks and files
+_WORK = threading.local()
+
+def _work_buffer(n: int) -> np.ndarray:
+    buf = getattr(_WORK, 'buf', None)
+    if buf is None or buf.shape[1] < n:
+        buf = _WORK.buf = np.empty((4, n))
+    return buf
+
+# Frames read per slice when streaming per-frame variables
+_FRAME_CHUNK = 65536
+
+def _frame_chunk_size(var) -> int:
+    """
+    Number of frames to read per slice of a per-frame variable.
+    Rounded to the variable's on-disk chunk length when it has one (netCDF4/HDF5).
+    """
+    chunking = getattr(var, 'chunking', None)
+    if chunking is not None:
+        layout = chunking()
+        if isinstance(layout, (list, tuple)) and layout and layout[0] > 0:
+            return max(1, _FRAME_CHUNK // layout[0]) * layout[0]
+    return _FRAME_CHUNK
+
+def _volume_stats(len_var, ang_var) -> Optional[Tuple[float, float, float]]:
+    """
+    (min, max, mean) cell volume over all frames, or None for an empty variable.
+    Frames are read one chunk at a time; each chunk's volumes land in the reused
+    scratch row and are folded into running min/max/sum, so no per-file volume
+    array is ever built.
+    """
+    n_box = len_var.shape[0]
+    if n_box == 0:
+        return None
+    step = _frame_chunk_size(len_var)
+    work = _work_buffer(min(step, n_box))
+    vmin = vmax = None
+    vsum = 0.0
+    for start in range(0, n_box, step):
+        stop = min(start + step, n_box)
+        angles = ang_var[start:stop] if ang_var is not None else None
+        vols = _calc_volume_array(len_var[start:stop], angles, work)
+        cmin, cmax = float(np.min(vols)), float(np.max(vols))
+        vmin = cmin if vmin is None else min(vmin, cmin)
+        vmax = cmax if vmax is None else max(vmax, cmax)
+        vsum += float(np.sum(vols))
+    return vmin, vmax, vsum / n_box
+
+_MISSING = object()
+
+# One getattr per attribute; the decoding step depends on the backend
+if NETCDF_BACKEND == "netCDF4":
+    def _get_nc_attr(obj, attr_name: str, default: str = "Unknown") -> str:
+        # netCDF4 already decodes text attributes to str
+        val = getattr(obj, attr_name, _MISSING)
+        if val is _MISSING:
+            return default
+        return val if isinstance(val, str) else str(val)
+else:
+    def _get_nc_attr(obj, attr_name: str, default: str = "Unknown") -> str:
+        # scipy hands text attributes back as raw bytes
+        val = getattr(obj, attr_name, _MISSING)
+        if val is _MISSING:
+            return default
+        if isinstance(val, bytes):
+            return val.decode('utf-8', errors='ignore')
+        return str(val)
+
+_SNIFF_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+_O_NOATIME = getattr(os, 'O_NOATIME', 0)
+_CDF_MAGIC = b'CDF'
+
+@functools.lru_cache(maxsize=4096)
+def _detect_format_cached(filepath: str, inode: int, mtime_ns: int, size: int) -> str:
+    # Raw fd read of the 4-byte magic; O_NOATIME (Linux) avoids an atime write
+    # but is only allowed for the file's owner, so retry without it on EPERM
     try:
-        with open(filepath, 'rb') as f:
-            header = f.read(4)
-            if header.startswith(b'CDF'):
-                return "NetCDF"
-    except (IOError, OSError):
-        pass
+        try:
+            fd = os.open(filepath, _SNIFF_FLAGS | _O_NOATIME)
+        except PermissionError:
+            if not _O_NOATIME:
+                raise
+            fd = os.open(filepath, _SNIFF_FLAGS)
+        try:
+            header = os.read(fd, 4)
+        finally:
+            os.close(fd)
+    except OSError:
+        return "ASCII"
+    if header.startswith(_CDF_MAGIC):
+        return "NetCDF"
     return "ASCII"
 
+def _detect_format(filepath: str) -> str:
+    # Keyed on the stat signature so rewritten files are sniffed again
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return "ASCII"
+    return _detect_format_cached(filepath, st.st_ino, st.st_mtime_ns, st.st_size)
+
 # -------------------------------
 # 4. NetCDF Parser
 # -------------------------------
 
-def _parse_netcdf_trajectory(filepath: str) -> TrajectoryMetadata:
+def _parse_netcdf_trajectory(filepath: str, sequence_only: bool = False) -> TrajectoryMetadata:
+    # sequence_only skips the reads analyze_sequence() never looks at: the
+    # variable-timestep sample and the temp0 statistics
     if np is None:
         raise ImportError("NumPy is required to parse NetCDF trajectories")
 
@@ -148,10 +293,7 @@ def _parse_netcdf_trajectory(filepath: str) -> TrajectoryMetadata:
 
     try:
         # Open
-        if NETCDF_BACKEND == "netCDF4":
-            ds = nc.Dataset(filepath, 'r')
-        else:
-            ds = nc.netcdf_file(filepath, 'r', mmap=False)
+        ds = _open_netcdf(filepath)
 
         try:
             # --- 1. Attributes ---
@@ -160,34 +302,46 @@ def _parse_netcdf_trajectory(filepath: str) -> TrajectoryMetadata:
             md.conventions = _get_nc_attr(ds, 'Conventions')
 
             # --- 2. Dimensions ---
-            # Robust way to get dimension lengths across different libs
+            # Dimension objects differ per library; _dim_size is resolved per backend
             dims = ds.dimensions
             if 'atom' in dims:
-                d = dims['atom']
-                md.n_atoms = d.size if hasattr(d, 'size') else (d if isinstance(d, int) else len(d))
+                md.n_atoms = _dim_size(dims['atom'])
             
             # --- 3. Variables & Time ---
-            vars_keys = ds.variables.keys()
+            # Snapshot the names once; the membership tests below then hit a plain set
+            vars_keys = frozenset(ds.variables)
             
             if 'time' in vars_keys:
                 md.has_time = True
                 t_var = ds.variables['time']
-                # Read all times (1D array, usually small memory footprint)
-                times = t_var[:]
-                md.n_frames = len(times)
+                md.n_frames = t_var.shape[0]
                 
                 if md.n_frames > 0:
-                    md.time_start = float(times[0])
-                    md.time_end = float(times[-1])
+                    md.time_start = float(t_var[0])
+                    md.time_end = float(t_var[md.n_frames - 1])
                     md.total_duration = md.time_end - md.time_start
                     
                     if md.n_frames > 1:
-                        # Calculate dt steps
-                        deltas = np.diff(times)
-                        md.avg_dt = float(np.mean(deltas))
+                        # Mean of the steps telescopes to the end-point difference
+                        md.avg_dt = md.total_duration / (md.n_frames - 1)
                         
-                        # Check for internal consistency
-                        if np.std(deltas) > 0.01:
+                    if md.n_frames > 2 and not sequence_only:
+                        # Check for internal consistency over every step. The time
+                        # axis is read in full on purpose: a strided sample folds a
+                        # single irregular step into a longer span, where a small
+                        # restart jump drops below the threshold. The axis is one
+                        # scalar per frame, so this read is small next to the
+                        # per-frame coordinate and cell data. Any step that departs
+                        # from the others by more than 0.02 ps (or 0.1% of the
+                        # largest step) is flagged
+                        times = np.asarray(t_var[:])
+                        deltas = np.diff(times.astype(np.float64))
+                        dmax = float(deltas.max())
+                        # Each stored time is off by up to half an ulp of its dtype,
+                        # so rounding alone can spread the steps by two ulps of the
+                        # largest time (float32 at t ~ 1e6 ps: 0.0625 ps per ulp)
+                        ulp = float(np.spacing(np.abs(times[[0, -1]]).max()))
+                        if dmax - float(deltas.min()) > max(2e-2, 1e-3 * dmax, 2.0 * ulp):
                             md.warnings.append("Variable timestep detected within file.")
             elif 'coordinates' in vars_keys:
                 # Fallback if no time variable: check coordinate shape
@@ -200,24 +354,23 @@ def _parse_netcdf_trajectory(filepath: str) -> TrajectoryMetadata:
             # --- 4. Box & Volume ---
             if 'cell_lengths' in vars_keys:
                 md.has_box = True
-                lengths = ds.variables['cell_lengths'][:] # (Frames, 3)
-                
-                angles = None
-                if 'cell_angles' in vars_keys:
-                    angles = ds.variables['cell_angles'][:] # (Frames, 3)
+                len_var = ds.variables['cell_lengths'] # (Frames, 3)
+                ang_var = ds.variables['cell_angles'] if 'cell_angles' in vars_keys else None
+
+                if ang_var is not None:
                     # Check first frame for triclinic
-                    if np.any(np.abs(angles[0] - 90.0) > 0.01):
+                    if np.any(np.abs(ang_var[0] - 90.0) > 0.01):
                         md.box_type = "Triclinic"
                     else:
                         md.box_type = "Orthogonal"
+                        # Right-angled cell: V = abc, so the angles need not be read at all
+                        ang_var = None
                 else:
                     md.box_type = "Orthogonal"
 
-                # Calculate Volumes
+                # Calculate Volumes, streaming frames so memory is bounded by the chunk size
                 try:
-                    vols = _calc_volume_array(lengths, angles)
-                    if len(vols) > 0:
-                        md.volume_stats = (float(np.min(vols)), float(np.max(vols)), float(np.mean(vols)))
+                    md.volume_stats = _volume_stats(len_var, ang_var)
                 except (ValueError, TypeError, IndexError) as e:
                     md.warnings.append(f"Volume calculation failed: {e}")
 
@@ -225,10 +378,23 @@ def _parse_netcdf_trajectory(filepath: str) -> TrajectoryMetadata:
             # 'temp0' in AMBER NetCDF REMD is the thermostat temperature index
             if 'temp0' in vars_keys:
                 md.is_remd = True
-                temps = ds.variables['temp0'][:]
                 md.remd_types.append("T-REMD (temp0)")
-                if len(temps) > 0:
-                    md.remd_temp_stats = (float(np.min(temps)), float(np.max(temps)), float(np.mean(temps)))
+            if 'temp0' in vars_keys and not sequence_only:
+                t0_var = ds.variables['temp0']
+                # Streamed like the volumes: a replica can leave and return to its
+                # starting temperature, so every frame has to be seen
+                n_temp = t0_var.shape[0]
+                step = _frame_chunk_size(t0_var)
+                tmin = tmax = None
+                tsum = 0.0
+                for start in range(0, n_temp, step):
+                    temps = t0_var[start:min(start + step, n_temp)]
+                    cmin, cmax = float(np.min(temps)), float(np.max(temps))
+                    tmin = cmin if tmin is None else min(tmin, cmin)
+                    tmax = cmax if tmax is None else max(tmax, cmax)
+                    tsum += float(np.sum(temps, dtype=np.float64))
+                if n_temp > 0:
+                    md.remd_temp_stats = (tmin, tmax, tsum / n_temp)
 
             if 'remd_dimtype' in vars_keys:
                 md.is_remd = True
@@ -252,13 +418,13 @@ def _parse_ascii_trajectory(filepath: str) -> TrajectoryMetadata:
         md.warnings.append("File empty or unreadable.")
     return md
 
-def parse_mdcrd(filepath: str) -> TrajectoryMetadata:
+def parse_mdcrd(filepath: str, sequence_only: bool = False) -> TrajectoryMetadata:
     if not os.path.exists(filepath):
         raise FileNotFoundError(f"{filepath} not found")
     
     fmt = _detect_format(filepath)
     if fmt == "NetCDF":
-        return _parse_netcdf_trajectory(filepath)
+        return _parse_netcdf_trajectory(filepath, sequence_only)
     else:
         return _parse_ascii_trajectory(filepath)
 
@@ -266,6 +432,40 @@ def parse_mdcrd(filepath: str) -> TrajectoryMetadata:
 # 5. Sequence Analysis (The Fix)
 # -------------------------------
 
+def _sequence_gaps(valid: Sequence[TrajectoryMetadata]) -> List[Tuple[int, float, float]]:
+    """
+    Returns (index, expected next start, difference) for each neighbouring pair
+    of time-sorted files that breaks continuity.
+    """
+    # Logic: Next Start should be approx Current End + Current DT
+    # If Current DT is missing (1 frame file), try using Next DT, or assume standard 1.0/2.0
+    # Tolerance: 10% of dt or 0.1ps, whichever is larger
+    if np is None:
+        gaps = []
+        for i in range(len(valid) - 1):
+            curr = valid[i]
+            next_f = valid[i + 1]
+            dt_ref = curr.avg_dt if curr.avg_dt else (next_f.avg_dt if next_f.avg_dt else 1.0)
+            expected_start = curr.time_end + dt_ref
+            delta = next_f.time_start - expected_start
+            if abs(delta) > max(0.1, dt_ref * 0.1):
+                gaps.append((i, expected_start, delta))
+        return gaps
+
+    # All neighbouring pairs at once; only the pairs that break continuity are
+    # visited in Python
+    starts = np.array([m.time_start for m in valid], dtype=np.float64)
+    ends = np.array([m.time_end for m in valid], dtype=np.float64)
+    dts = np.array([m.avg_dt or 0.0 for m in valid], dtype=np.float64)
+
+    dt_ref = np.where(dts[:-1] != 0.0, dts[:-1], np.where(dts[1:] != 0.0, dts[1:], 1.0))
+    expected_starts = ends[:-1] + dt_ref
+    deltas = starts[1:] - expected_starts
+    tols = np.maximum(0.1, dt_ref * 0.1)
+
+    return [(int(i), float(expected_starts[i]), float(deltas[i]))
+            for i in np.flatnonzero(np.abs(deltas) > tols)]
+
 def analyze_sequence(metadatas: Sequence[TrajectoryMetadata]) -> str:
     """
     Checks continuity of trajectory files based on timestamps and calculated dt.
@@ -291,33 +491,17 @@ def analyze_sequence(metadatas: Sequence[TrajectoryMetadata]) -> str:
     t_first = valid[0].time_start
     t_last = valid[-1].time_end
     
-    # Analyze continuity
-    gaps = 0
-    bad_overlaps = 0
-    
     # Track volume statistics across the whole run
     all_avg_vols = [m.volume_stats[2] for m in valid if m.volume_stats]
     
-    for i in range(len(valid) - 1):
+    gap_list = _sequence_gaps(valid)
+    gaps = len(gap_list)
+    for i, expected_start, delta in gap_list:
         curr = valid[i]
-        next_f = valid[i+1]
-        
-        # Logic: Next Start should be approx Current End + Current DT
-        # If Current DT is missing (1 frame file), try using Next DT, or assume standard 1.0/2.0
-        
-        dt_ref = curr.avg_dt if curr.avg_dt else (next_f.avg_dt if next_f.avg_dt else 1.0)
-        
-        expected_start = curr.time_end + dt_ref
-        delta = next_f.time_start - expected_start
-        
-        # Tolerance: 10% of dt or 0.1ps, whichever is larger
-        tol = max(0.1, dt_ref * 0.1)
-        
-        if abs(delta) > tol:
-            gaps += 1
-            lines.append(f"  [Gap/Overlap] {os.path.basename(curr.filename)} ends {curr.time_end:.2f} | "
-                         f"{os.path.basename(next_f.filename)} starts {next_f.time_start:.2f} "
-                         f"(Expected ~{expected_start:.2f}, Diff {delta:.2f})")
+        next_f = valid[i + 1]
+        lines.append(f"  [Gap/Overlap] {os.path.basename(curr.filename)} ends {curr.time_end:.2f} | "
+                     f"{os.path.basename(next_f.filename)} starts {next_f.time_start:.2f} "
+                     f"(Expected ~{expected_start:.2f}, Diff {delta:.2f})")
 
     total_ns = (t_last - t_first) / 1000.0
     
@@ -369,41 +553,155 @@ def summarize_single(md: TrajectoryMetadata) -> str:
     return "\n".join(s)
 
 # -------------------------------
-# 6. CLI
+# 6. Parse Index (CLI cache)
 # -------------------------------
 
-if __name__ == "__main__":
+def load_index(index_path: str) -> Dict[str, dict]:
+    """Load a parse index written by save_index(); missing or corrupt files give an empty index."""
+    try:
+        with open(index_path, 'r') as f:
+            index = json.load(f)
+    except (IOError, OSError, ValueError):
+        return {}
+    return index if isinstance(index, dict) else {}
+
+def save_index(index_path: str, index: Dict[str, dict]) -> None:
+    """Write the parse index atomically (temp file + rename)."""
+    tmp_path = f"{index_path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(index, f)
+    os.replace(tmp_path, index_path)
+
+def _index_lookup(filepath: str, index: Dict[str, dict],
+                  sequence_only: bool = False) -> Optional[TrajectoryMetadata]:
+    st = os.stat(filepath)
+    entry = index.get(os.path.abspath(filepath))
+    if not (entry and entry.get('mtime_ns') == st.st_mtime_ns and entry.get('size') == st.st_size
+            and entry.get('backend') == NETCDF_BACKEND):
+        return None
+    # Sequence-only entries lack the REMD/timestep details a full parse reports
+    if entry.get('sequence_only', False) and not sequence_only:
+        return None
+    data = dict(entry['metadata'], filename=filepath)
+    # JSON stores tuples as lists
+    for name in ('volume_stats', 'remd_temp_stats'):
+        if data.get(name) is not None:
+            data[name] = tuple(data[name])
+    return TrajectoryMetadata(**data)
+
+def _index_store(filepath: str, index: Dict[str, dict], md: TrajectoryMetadata,
+                 sequence_only: bool = False) -> None:
+    st = os.stat(filepath)
+    index[os.path.abspath(filepath)] = {
+        'mtime_ns': st.st_mtime_ns,
+        'size': st.st_size,
+        'backend': NETCDF_BACKEND,
+        'sequence_only': sequence_only,
+        'metadata': asdict(md),
+    }
+
+def _parse_for_cli(filepath: str,
+                   sequence_only: bool = False) -> Tuple[Optional[TrajectoryMetadata], Optional[str]]:
+    """parse_mdcrd() for the CLI: returns (metadata, error message). Module level so it pickles."""
+    try:
+        return parse_mdcrd(filepath, sequence_only), None
+    except (IOError, OSError, ValueError, FileNotFoundError) as e:
+        return None, f"Error {filepath}: {e}"
+
+def _expand_input(pattern: str) -> List[str]:
+    """
+    glob.glob() for a CLI argument. A wildcard in the last component only is matched
+    against one os.scandir() listing; wildcards in directory parts still go through glob.
+    """
+    if not glob.has_magic(pattern):
+        return [pattern]
+    dirname, basename = os.path.split(pattern)
+    if not basename or glob.has_magic(dirname):
+        return glob.glob(pattern)
+    try:
+        with os.scandir(dirname or os.curdir) as it:
+            names = [e.name for e in it]
+    except OSError:
+        return []
+    if not basename.startswith('.'):
+        # glob skips hidden entries unless the pattern names them
+        names = [n for n in names if not n.startswith('.')]
+    return [os.path.join(dirname, n) for n in fnmatch.filter(names, basename)]
+
+# -------------------------------
+# 7. CLI
+# -------------------------------
+
+def main(argv: Optional[List[str]] = None) -> None:
     import argparse
     parser = argparse.ArgumentParser(description="Parse AMBER mdcrd/nc files.")
     parser.add_argument("inputs", nargs='+', help="Input files")
-    parser.add_argument("--sequence-only", action="store_true", help="Show only sequence summary")
+    parser.add_argument("--sequence-only", action="store_true",
+                        help="Show only sequence summary (skips reads it does not need)")
+    parser.add_argument("--index", metavar="FILE",
+                        help="JSON parse index; unchanged files listed in it are not re-parsed")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Worker processes for parsing more than 4 files (default: CPU count)")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
-    # Expand globs
-    files = []
+    # Expand globs; the dict drops duplicates from overlapping patterns
+    seen: Dict[str, None] = {}
     for inp in args.inputs:
-        matched = glob.glob(inp)
-        if matched: files.extend(matched)
-        else: files.append(inp)
+        matched = _expand_input(inp)
+        for f in (matched or [inp]):
+            seen.setdefault(f, None)
     
-    files = sorted(list(set(files)))
+    files = sorted(seen)
     
     print(f"--- Processing {len(files)} files ---\n")
     if not HAS_NETCDF:
         print("Warning: NetCDF libraries not found. Deep parsing disabled.")
 
+    index = load_index(args.index) if args.index else None
+
+    results: Dict[str, Tuple[Optional[TrajectoryMetadata], Optional[str]]] = {}
+    if index is not None:
+        for f in files:
+            try:
+                md = _index_lookup(f, index, args.sequence_only)
+            except OSError:
+                continue  # Reported by the parse below
+            if md is not None:
+                results[f] = (md, None)
+
+    # Files parse independently; spread them over processes when there are enough.
+    # Small batches stay serial, where starting the pool would cost more than it saves
+    todo = [f for f in files if f not in results]
+    parse = functools.partial(_parse_for_cli, sequence_only=args.sequence_only)
+    jobs = args.jobs or os.cpu_count() or 1
+    if jobs > 1 and len(todo) > 4:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=jobs) as ex:
+            results.update(zip(todo, ex.map(parse, todo, chunksize=4)))
+    else:
+        results.update((f, parse(f)) for f in todo)
+
+    parsed_now = set(todo)
     metas = []
     for f in files:
-        try:
-            md = parse_mdcrd(f)
-            metas.append(md)
-            if not args.sequence_only:
-                print(summarize_single(md))
-        except (IOError, OSError, ValueError, FileNotFoundError) as e:
-            print(f"Error {f}: {e}")
+        md, error = results[f]
+        if error:
+            print(error)
+            continue
+        metas.append(md)
+        if index is not None and f in parsed_now:
+            _index_store(f, index, md, args.sequence_only)
+        if not args.sequence_only:
+            print(summarize_single(md))
+
+    if index is not None:
+        save_index(args.index, index)
 
     if len(metas) > 1:
         print("\n" + "="*40)
         print(analyze_sequence(metas))
-        print("="*40)
\ No newline at end of file
+        print("="*40)
+
+if __name__ == "__main__":
+    main()
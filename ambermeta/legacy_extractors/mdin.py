@@ -7,6 +7,8 @@ import os
 from dataclasses import dataclass, field
 from typing import Dict, List, Any, Union, Optional, Sequence
 
+from ambermeta.utils import _DATACLASS_SLOTS
+
 # -------------------------------
 # 1. Constants & Lookups
 # -------------------------------
@@ -35,11 +37,23 @@ BAROSTATS = {
     2: "Monte Carlo (Anisotropic if ntp=2)", # Or isotropic if ntp=1, context depends on barostat flag
 }
 
+# Numeric token classifiers (used with fullmatch); floats accept Fortran D-notation
+_INT_RE = re.compile(r"[-+]?\d+")
+_FLOAT_RE = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eEdD][-+]?\d+)?")
+_NUMERIC_START = frozenset("+-.0123456789")
+# NaN/Inf spellings float() accepts but the numeric patterns above do not
+_NONFINITE_TOKENS = frozenset(
+    sign + word for sign in ("", "+", "-") for word in ("nan", "inf", "infinity")
+)
+
+# Whitespace, trailing commas and quotes around namelist values
+_VALUE_STRIP_CHARS = " \t\r\n\f\v,\"'"
+
 # -------------------------------
 # 2. Metadata Dataclasses
 # -------------------------------
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class WtScheduleEntry:
     """
     Represents a single &wt namelist entry (varying conditions).
@@ -58,7 +72,7 @@ class WtScheduleEntry:
         return self.quantity.upper() == "END"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class MdinMetadata:
     """
     Represents the configuration of a SINGLE mdin file.
@@ -119,32 +133,38 @@ def _clean_value(val: str) -> Any:
     - Preserves shell variables (${var}, $(cmd)) as strings.
     - Handles Fortran booleans and D-notation floats.
     """
-    val = val.strip().strip(",").strip('"').strip("'")
-    
+    # One strip call covers whitespace, trailing commas and quotes
+    val = val.strip(_VALUE_STRIP_CHARS)
+
     if not val:
         return ""
-    
+
     # Shell variables or command substitutions -> keep as string
     if "$" in val:
         return val
-        
+
+    first = val[0]
+
     # Fortran Booleans
-    if val.lower() == ".true.":
-        return True
-    if val.lower() == ".false.":
-        return False
+    if first == ".":
+        lowered = val.lower()
+        if lowered == ".true.":
+            return True
+        if lowered == ".false.":
+            return False
+
+    # Only tokens starting with a sign, digit or dot can be numeric
+    if first not in _NUMERIC_START:
+        return float(val) if val.lower() in _NONFINITE_TOKENS else val
 
     # Integers
-    try:
+    if _INT_RE.fullmatch(val):
         return int(val)
-    except ValueError:
-        pass
 
     # Floats (including Fortran D-notation)
-    try:
+    if _FLOAT_RE.fullmatch(val):
         return float(val.replace("d", "e").replace("D", "E"))
-    except ValueError:
-        return val
+    return float(val) if val.lower() in _NONFINITE_TOKENS else val
 
 
 def _parse_namelist_string(content: str) -> Dict[str, Any]:
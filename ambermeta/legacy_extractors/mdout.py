@@ -5,9 +5,13 @@ import os
 import glob
 import math
 import statistics
+from collections import deque
 from dataclasses import dataclass, field
+from itertools import islice
 from typing import Dict, List, Optional, Any, Tuple, Sequence
 
+from ambermeta.utils import _DATACLASS_SLOTS
+
 # -------------------------------
 # 1. Constants & Lookups
 # -------------------------------
@@ -27,11 +31,23 @@ BAROSTATS = {
     2: "Monte Carlo"
 }
 
+# Matches "Key = Value" or "Key=Value"
+# Keys can contain (), -, .
+_KV_RE = re.compile(r"([A-Za-z0-9_\-\(\)\./]+)\s*=\s*([-\d\.\*]+)")
+
+# Numeric token classifiers (used with fullmatch)
+_INT_RE = re.compile(r"[-+]?\d+")
+_FLOAT_RE = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+# Lines held in memory while parsing: the current line plus the most any
+# multi-line block (RESOURCE USE) looks ahead
+_LOOKAHEAD = 15
+
 # -------------------------------
 # 2. Welford's Online Statistics Algorithm
 # -------------------------------
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class StreamingStats:
     """
     Implements Welford's online algorithm for streaming mean and variance.
@@ -81,7 +97,7 @@ class StreamingStats:
 # 3. Metadata Dataclasses
 # -------------------------------
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ThermoStats:
     """
     Stores accumulated statistics for the entire run based on parsed frames.
@@ -236,7 +252,7 @@ class ThermoStats:
         if interval == 0: return 0.0 # Single frame
         return (self.time_end - self.time_start + interval) / 1000.0
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class MdoutMetadata:
     filename: str
 
@@ -283,17 +299,12 @@ class MdoutMetadata:
 def _parse_value(val_str: str) -> Any:
     val_str = val_str.strip().strip(',')
     if '*******' in val_str: return None
-    try:
-        if '.' in val_str: return float(val_str)
-        return int(val_str)
-    except ValueError:
-        return val_str
+    if '.' in val_str:
+        return float(val_str) if _FLOAT_RE.fullmatch(val_str) else val_str
+    return int(val_str) if _INT_RE.fullmatch(val_str) else val_str
 
 def _extract_key_values(line: str) -> Dict[str, Any]:
-    # Matches "Key = Value" or "Key=Value"
-    # Keys can contain (), -, .
-    pattern = re.compile(r"([A-Za-z0-9_\-\(\)\./]+)\s*=\s*([-\d\.\*]+)")
-    matches = pattern.findall(line)
+    matches = _KV_RE.findall(line)
     return {k.strip(): _parse_value(v) for k, v in matches}
 
 def _calc_stats(data_list: List[float]) -> Tuple[Optional[float], Optional[float]]:
@@ -311,115 +322,129 @@ def parse_mdout(filepath: str) -> MdoutMetadata:
         md.warnings.append("File not found.")
         return md
 
-    with open(filepath, 'r', errors='replace') as f:
-        lines = f.readlines()
-
     in_summary_section = False # To ignore "Averages" and "RMS" blocks
-    
-    for i, line in enumerate(lines):
+    in_header = True
+
+    # Stream the file through a short window (window[0] is the current line)
+    # instead of holding every line of a long production log in memory
+    with open(filepath, 'r', errors='replace') as f:
+        window = deque(islice(f, _LOOKAHEAD))
+        while window:
+            line = window[0]
         
-        # --- 1. Header & Engine ---
-        if "PMEMD implementation of SANDER" in line:
-            md.program = "PMEMD"
-        elif "Amber" in line and "PMEMD" in line:
-            md.program = "PMEMD"
+            # Sections 1-3 of the log (header, RESOURCE USE, CONTROL DATA) all
+            # precede "4.  RESULTS"; past it only frames and timings are left, so
+            # the header checks stop running for the bulk of the file
+            if in_header and "4.  RESULTS" in line:
+                in_header = False
+
+            if in_header:
+                # --- 1. Header & Engine ---
+                if "PMEMD implementation of SANDER" in line:
+                    md.program = "PMEMD"
+                elif "Amber" in line and "PMEMD" in line:
+                    md.program = "PMEMD"
         
-        if "Release" in line and md.version == "Unknown":
-            parts = line.split("Release")
-            if len(parts) > 1: md.version = parts[1].split()[0].strip().strip(',')
+                if "Release" in line and md.version == "Unknown":
+                    parts = line.split("Release")
+                    if len(parts) > 1: md.version = parts[1].split()[0].strip().strip(',')
 
-        if line.startswith("| Run on"):
-            md.run_date = line.replace("| Run on", "").strip()
+                if line.startswith("| Run on"):
+                    md.run_date = line.replace("| Run on", "").strip()
         
-        if "CUDA Device Name:" in line:
-            md.gpu_model = line.split(":", 1)[1].strip()
-
-        # --- 2. Resource Use (Multi-line) ---
-        if "RESOURCE   USE" in line:
-            # Scan next few lines for NATOM, NRES
-            for offset in range(1, 15):
-                if i + offset >= len(lines): break
-                sub = lines[i+offset]
-                if "CONTROL  DATA" in sub: break
+                if "CUDA Device Name:" in line:
+                    md.gpu_model = line.split(":", 1)[1].strip()
+
+                # --- 2. Resource Use (Multi-line) ---
+                if "RESOURCE   USE" in line:
+                    # Scan next few lines for NATOM, NRES
+                    for offset in range(1, 15):
+                        if offset >= len(window): break
+                        sub = window[offset]
+                        if "CONTROL  DATA" in sub: break
                 
-                kvs = _extract_key_values(sub)
-                if 'NATOM' in kvs: md.natoms = kvs['NATOM']
-                if 'NRES' in kvs: md.nres = kvs['NRES']
+                        kvs = _extract_key_values(sub)
+                        if 'NATOM' in kvs: md.natoms = kvs['NATOM']
+                        if 'NRES' in kvs: md.nres = kvs['NRES']
         
-        if "BOX TYPE:" in line:
-            md.box_type = line.split(":", 1)[1].strip()
-
-        # --- 3. Control Data ---
-        # Parse this section specifically to handle compressed lines like t=1000.0,dt=0.004
-        if "nstlim" in line and "=" in line:
-            kvs = _extract_key_values(line)
-            if 'nstlim' in kvs: md.nstlim = kvs['nstlim']
-            if 'dt' in kvs: md.dt = kvs['dt']
+                if "BOX TYPE:" in line:
+                    md.box_type = line.split(":", 1)[1].strip()
+
+                # --- 3. Control Data ---
+                # Parse this section specifically to handle compressed lines like t=1000.0,dt=0.004
+                if "nstlim" in line and "=" in line:
+                    kvs = _extract_key_values(line)
+                    if 'nstlim' in kvs: md.nstlim = kvs['nstlim']
+                    if 'dt' in kvs: md.dt = kvs['dt']
             
-        if "dt" in line and "=" in line:
-            kvs = _extract_key_values(line)
-            if 'dt' in kvs: md.dt = kvs['dt']
+                if "dt" in line and "=" in line:
+                    kvs = _extract_key_values(line)
+                    if 'dt' in kvs: md.dt = kvs['dt']
 
-        if "cut" in line and "=" in line:
-            kvs = _extract_key_values(line)
-            if 'cut' in kvs: md.cutoff = kvs['cut']
+                if "cut" in line and "=" in line:
+                    kvs = _extract_key_values(line)
+                    if 'cut' in kvs: md.cutoff = kvs['cut']
             
-        if "ntt" in line and "=" in line:
-            kvs = _extract_key_values(line)
-            if 'ntt' in kvs:
-                md.thermostat = THERMOSTATS.get(kvs['ntt'], str(kvs['ntt']))
+                if "ntt" in line and "=" in line:
+                    kvs = _extract_key_values(line)
+                    if 'ntt' in kvs:
+                        md.thermostat = THERMOSTATS.get(kvs['ntt'], str(kvs['ntt']))
                 
-        if "temp0" in line and "=" in line:
-            kvs = _extract_key_values(line)
-            if 'temp0' in kvs: md.target_temp = kvs['temp0']
+                if "temp0" in line and "=" in line:
+                    kvs = _extract_key_values(line)
+                    if 'temp0' in kvs: md.target_temp = kvs['temp0']
             
-        if "ntp" in line and "=" in line:
-            kvs = _extract_key_values(line)
-            if 'ntp' in kvs:
-                md.barostat = BAROSTATS.get(kvs['ntp'], str(kvs['ntp']))
+                if "ntp" in line and "=" in line:
+                    kvs = _extract_key_values(line)
+                    if 'ntp' in kvs:
+                        md.barostat = BAROSTATS.get(kvs['ntp'], str(kvs['ntp']))
                 
-        if "ntc" in line and "=" in line:
-            kvs = _extract_key_values(line)
-            if 'ntc' in kvs and kvs['ntc'] > 1:
-                md.shake_active = True
-
-        # --- 4. Frame Processing ---
-        if "A V E R A G E S" in line or "R M S  F L U C T U A T I O N S" in line:
-            in_summary_section = True
+                if "ntc" in line and "=" in line:
+                    kvs = _extract_key_values(line)
+                    if 'ntc' in kvs and kvs['ntc'] > 1:
+                        md.shake_active = True
+
+            # --- 4. Frame Processing ---
+            if "A V E R A G E S" in line or "R M S  F L U C T U A T I O N S" in line:
+                in_summary_section = True
             
-        if "NSTEP =" in line and "TIME(PS)" in line:
-            if not in_summary_section:
-                # Combine this line and next ~9 lines to capture all properties
-                combined = line.strip()
-                for offset in range(1, 10):
-                    if i + offset >= len(lines): break
-                    nl = lines[i+offset].strip()
-                    if "---" in nl or not nl: break
-                    combined += " " + nl
+            if "NSTEP =" in line and "TIME(PS)" in line:
+                if not in_summary_section:
+                    # Combine this line and next ~9 lines to capture all properties
+                    combined = line.strip()
+                    for offset in range(1, 10):
+                        if offset >= len(window): break
+                        nl = window[offset].strip()
+                        if "---" in nl or not nl: break
+                        combined += " " + nl
                 
-                data = _extract_key_values(combined)
-                md.stats.add_frame(data)
+                    data = _extract_key_values(combined)
+                    md.stats.add_frame(data)
 
-        # --- 5. Performance ---
-        if "Final Performance Info" in line or "TIMINGS" in line:
-            in_summary_section = False 
+            # --- 5. Performance ---
+            if "Final Performance Info" in line or "TIMINGS" in line:
+                in_summary_section = False 
             
-        if "Final Performance Info" in line:
-            md.finished_properly = True
+            if "Final Performance Info" in line:
+                md.finished_properly = True
             
-        if "ns/day =" in line:
-            kvs = _extract_key_values(line)
-            if 'ns/day' in kvs: md.ns_per_day = kvs['ns/day']
+            if "ns/day =" in line:
+                kvs = _extract_key_values(line)
+                if 'ns/day' in kvs: md.ns_per_day = kvs['ns/day']
             
-        if "Total wall time:" in line:
-            parts = line.split()
-            for idx, p in enumerate(parts):
-                if "time:" in p and idx+1 < len(parts):
-                    try:
-                        md.wall_time_seconds = float(parts[idx+1])
-                    except (ValueError, IndexError) as e:
-                        md.warnings.append(f"Failed to parse wall time: {e}")
-
+            if "Total wall time:" in line:
+                parts = line.split()
+                for idx, p in enumerate(parts):
+                    if "time:" in p and idx+1 < len(parts):
+                        try:
+                            md.wall_time_seconds = float(parts[idx+1])
+                        except (ValueError, IndexError) as e:
+                            md.warnings.append(f"Failed to parse wall time: {e}")
+
+            window.popleft()
+            nxt = next(f, None)
+            if nxt is not None:
+                window.append(nxt)
     return md
 
 # -------------------------------
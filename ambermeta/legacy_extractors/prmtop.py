@@ -6,6 +6,8 @@ from collections import Counter
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple, Any, Sequence, Set
 
+from ambermeta.utils import _DATACLASS_SLOTS
+
 # -------------------------------
 # 1. Heuristics based on Amber Reference Manual (Part II)
 # -------------------------------
@@ -215,7 +217,7 @@ class PrmtopFile:
 # 3. High-level metadata
 # -------------------------------
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PrmtopMetadata:
     filename: str
     version: Optional[str] = None
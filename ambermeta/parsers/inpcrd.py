@@ -2,11 +2,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from ambermeta.utils import MetadataBase
+from ambermeta.utils import _DATACLASS_SLOTS, MetadataBase
 from ambermeta.legacy_extractors import inpcrd as legacy
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class InpcrdData(MetadataBase):
     details: legacy.InpcrdMetadata | None = None
 
@@ -2,11 +2,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from ambermeta.utils import MetadataBase
+from ambermeta.utils import _DATACLASS_SLOTS, MetadataBase
 from ambermeta.legacy_extractors import mdout as legacy
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class MdoutData(MetadataBase):
     details: legacy.MdoutMetadata | None = None
 
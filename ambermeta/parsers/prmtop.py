@@ -3,11 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional
 
-from ambermeta.utils import MetadataBase
+from ambermeta.utils import _DATACLASS_SLOTS, MetadataBase
 from ambermeta.legacy_extractors import prmtop as legacy
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PrmtopData(MetadataBase):
     details: legacy.PrmtopMetadata | None = None
 
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import copy
+import functools
 import json
 import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field, is_dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Pattern
+from typing import Any, Callable, Collection, Dict, List, Optional, Pattern, Tuple
 
 import re
 
@@ -28,6 +33,11 @@ except ImportError:  # pragma: no cover - optional dependency
     except ImportError:
         tomllib = None
 
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 import csv
 from io import StringIO
 
@@ -818,8 +828,20 @@ def validate_manifest(
     manifest: Dict[str, Dict[str, str]] | List[Dict[str, str]],
     directory: Optional[str] = None,
 ) -> None:
+    _check_manifest_paths(_resolve_manifest_entries(manifest, directory))
+
+
+def _resolve_manifest_entries(
+    manifest: Dict[str, Dict[str, str]] | List[Dict[str, str]],
+    directory: Optional[str],
+) -> List[Tuple[Dict[str, Any], Dict[str, str]]]:
+    """Normalize manifest entries and resolve their file paths in one pass.
+
+    Returns ``(entry, resolved)`` pairs where ``resolved`` maps each file kind
+    present in the entry to its path, joined onto ``directory`` when relative.
+    """
     kinds = {"prmtop", "inpcrd", "mdin", "mdout", "mdcrd"}
-    missing: List[str] = []
+    resolved_entries: List[Tuple[Dict[str, Any], Dict[str, str]]] = []
     for entry in _normalize_manifest(manifest):
         name = entry.get("name")
         if not name:
@@ -837,26 +859,43 @@ def validate_manifest(
             if path is None:
                 continue
             if directory and not os.path.isabs(path):
-                resolved[kind] = os.path.join(directory, path)
+                resolved[kind] = _intern_str(os.path.join(directory, path))
             else:
-                resolved[kind] = path
+                resolved[kind] = _intern_str(path)
 
+        resolved_entries.append((entry, resolved))
+    return resolved_entries
+
+
+def _check_manifest_paths(resolved_entries: List[Tuple[Dict[str, Any], Dict[str, str]]]) -> None:
+    missing: List[str] = []
+    for entry, resolved in resolved_entries:
         for kind, path in resolved.items():
             if not os.path.exists(path):
-                missing.append(f"stage '{name}', {kind}: {path}")
+                missing.append(f"stage '{entry['name']}', {kind}: {path}")
 
     if missing:
         message = "Manifest references missing files:\n" + "\n".join(missing)
         raise FileNotFoundError(message)
 
 
+def _intern_str(value: Any) -> Any:
+    """Intern exact ``str`` values; other types pass through.
+
+    Stages naming the same file (typically one shared topology) then hold a
+    single path object, and role strings compare by identity in role filters.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
 def _manifest_to_stages(
     manifest: Dict[str, Dict[str, str]] | List[Dict[str, str]],
     directory: Optional[str],
-    include_roles: Optional[List[str]],
-    include_stems: Optional[List[str]],
+    include_roles: Optional[Collection[str]],
+    include_stems: Optional[Collection[str]],
     restart_files: Optional[Dict[str, str]],
     progress_callback: Optional[Callable[[str, int, int], None]] = None,
+    restart_cache: Optional[Dict[str, Any]] = None,
 ) -> List[SimulationStage]:
     """Convert manifest entries to SimulationStage objects.
 
@@ -874,57 +913,50 @@ def _manifest_to_stages(
         Mapping of stage name/role to restart file paths.
     progress_callback:
         Optional callback function(stage_name, current, total) for progress reporting.
+    restart_cache:
+        Optional mapping of restart path to parsed data shared across stages.
     """
-    kinds = {"prmtop", "inpcrd", "mdin", "mdout", "mdcrd"}
     stages: List[SimulationStage] = []
-    validate_manifest(manifest, directory)
-
-    # Count total entries for progress reporting
-    entries = list(_normalize_manifest(manifest))
+    # Paths are resolved once and shared by the existence check and the
+    # stage loop below, rather than normalizing the manifest twice
+    entries = _resolve_manifest_entries(manifest, directory)
+    _check_manifest_paths(entries)
     total = len(entries)
 
-    for idx, entry in enumerate(entries):
-        name = entry.get("name")
-        if not name:
-            raise ValueError("Each manifest entry must include a 'name'.")
-        stage_role = entry.get("stage_role")
+    for idx, (entry, resolved) in enumerate(entries):
+        name = entry["name"]
+        stage_role = _intern_str(entry.get("stage_role"))
 
         # Report progress
         if progress_callback:
             progress_callback(name, idx + 1, total)
 
-        files = entry.get("files", {})
-        paths = {k: v for k, v in entry.items() if k in kinds}
-        if isinstance(files, dict):
-            for kind, path in files.items():
-                if kind in kinds and path is not None:
-                    paths.setdefault(kind, path)
-
-        resolved = {}
-        for kind, path in paths.items():
-            if path is None:
-                continue
-            if directory and not os.path.isabs(path):
-                resolved[kind] = os.path.join(directory, path)
-            else:
-                resolved[kind] = path
+        if include_stems and name not in include_stems:
+            continue
 
         stage = SimulationStage(name=name, stage_role=stage_role)
 
-        if "prmtop" in resolved:
-            stage.prmtop = PrmtopParser(resolved["prmtop"]).parse()
+        # Filters run as soon as the name and role are known, so excluded
+        # entries are not parsed (only mdin can still supply the role)
         if "mdin" in resolved:
             stage.mdin = MdinParser(resolved["mdin"]).parse()
-            inferred_role = getattr(stage.mdin.details, "stage_role", None)
+            inferred_role = _intern_str(getattr(stage.mdin.details, "stage_role", None))
             if not stage.stage_role and inferred_role:
                 stage.stage_role = inferred_role
                 stage.validation.append(f"INFO: stage_role '{inferred_role}' inferred from mdin file")
+        if include_roles and stage.stage_role and stage.stage_role not in include_roles:
+            continue
+        if include_roles and not stage.stage_role:
+            continue
+
+        if "prmtop" in resolved:
+            stage.prmtop = PrmtopParser(resolved["prmtop"]).parse()
         if "mdout" in resolved:
             stage.mdout = MdoutParser(resolved["mdout"]).parse()
         if "mdcrd" in resolved:
             stage.mdcrd = MdcrdParser(resolved["mdcrd"]).parse()
         if "inpcrd" in resolved:
-            stage.inpcrd = InpcrdParser(resolved["inpcrd"]).parse()
+            stage.inpcrd = _parse_restart(resolved["inpcrd"], restart_cache)
             stage.restart_path = resolved["inpcrd"]
 
         restart_source = None
@@ -935,16 +967,9 @@ def _manifest_to_stages(
                     break
 
         if restart_source and "inpcrd" not in resolved:
-            stage.inpcrd = InpcrdParser(restart_source).parse()
+            stage.inpcrd = _parse_restart(restart_source, restart_cache)
             stage.restart_path = restart_source
 
-        if include_stems and stage.name not in include_stems:
-            continue
-        if include_roles and stage.stage_role and stage.stage_role not in include_roles:
-            continue
-        if include_roles and not stage.stage_role:
-            continue
-
         gap_info = entry.get("gaps") or entry.get("gap")
         notes = entry.get("notes")
         if isinstance(gap_info, dict):
@@ -976,6 +1001,13 @@ def _manifest_to_stages(
     return stages
 
 
+def _path_stem(path: str) -> str:
+    """``Path(path).stem`` for plain string paths, without the Path object."""
+    name = os.path.basename(path)
+    dot = name.rfind(".")
+    return name[:dot] if 0 < dot < len(name) - 1 else name
+
+
 def detect_numeric_sequences(filenames: List[str]) -> Dict[str, List[str]]:
     """Detect numeric sequences in filenames for automatic grouping.
 
@@ -1003,7 +1035,7 @@ def detect_numeric_sequences(filenames: List[str]) -> Dict[str, List[str]]:
     groups: Dict[str, List[tuple[int, str]]] = {}
 
     for filename in filenames:
-        stem = Path(filename).stem
+        stem = _path_stem(filename)
 
         # Try suffix pattern first (prod_001, prod_002)
         match = suffix_pattern.match(stem)
@@ -1131,6 +1163,7 @@ def infer_stage_role_from_content(
 def auto_detect_restart_chain(
     stages: List[SimulationStage],
     directory: str,
+    restart_cache: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, str]:
     """Automatically detect restart file chains between stages.
 
@@ -1145,13 +1178,18 @@ def auto_detect_restart_chain(
         List of simulation stages to analyze.
     directory:
         Base directory for finding restart files.
+    restart_cache:
+        Optional mapping of restart path to parsed data. Candidates already in
+        it are not parsed again, and new parses are added to it.
 
     Returns
     -------
     Dictionary mapping stage names to their restart file paths.
     """
     # Collect all potential restart files
-    restart_candidates: List[tuple[str, InpcrdData]] = []
+    # (path, stem, parsed data); stems are computed once here rather than for
+    # every stage the candidate is scored against
+    restart_candidates: List[tuple[str, str, InpcrdData]] = []
 
     ext_map = {".rst", ".rst7", ".ncrst", ".restrt", ".inpcrd"}
 
@@ -1164,8 +1202,8 @@ def auto_detect_restart_chain(
         if ext.lower() not in ext_map:
             continue
         try:
-            data = InpcrdParser(full_path).parse()
-            restart_candidates.append((full_path, data))
+            data = _parse_restart(full_path, restart_cache)
+            restart_candidates.append((full_path, os.path.splitext(fname)[0], data))
         except (IOError, OSError, ValueError):
             continue
 
@@ -1190,7 +1228,7 @@ def auto_detect_restart_chain(
         # Try to find matching restart
         best_match: Optional[tuple[str, float]] = None
 
-        for rst_path, rst_data in restart_candidates:
+        for rst_path, rst_stem, rst_data in restart_candidates:
             if not rst_data or not rst_data.details:
                 continue
 
@@ -1200,7 +1238,6 @@ def auto_detect_restart_chain(
                 continue
 
             # Check naming convention match
-            rst_stem = Path(rst_path).stem
             stage_stem = stage.name.replace("/", "_")
 
             # Common patterns: stagename.rst -> next stage, prev_stage.rst7 -> current
@@ -1240,6 +1277,33 @@ def auto_detect_restart_chain(
     return restart_mapping
 
 
+def _scan_directory(directory: str, recursive: bool):
+    """Yield ``(relative path, DirEntry)`` for the non-directory entries under ``directory``.
+
+    One ``os.scandir`` listing per directory, in ``os.listdir``/``os.walk`` order:
+    a directory's own entries first, then its subdirectories depth-first.
+    Like ``os.walk``, the recursive scan skips unreadable directories and does
+    not follow symlinked ones; a non-recursive scan raises like ``os.listdir``.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        if not recursive:
+            raise
+        return
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir():
+            if recursive and not entry.is_symlink():
+                subdirs.append(entry)
+        else:
+            yield entry.name, entry
+    for subdir in subdirs:
+        for rel_path, entry in _scan_directory(subdir.path, recursive):
+            yield os.path.join(subdir.name, rel_path), entry
+
+
 def smart_group_files(
     directory: str,
     pattern: Optional[str] = None,
@@ -1262,26 +1326,6 @@ def smart_group_files(
     -------
     Dictionary mapping stage names to file paths by type.
     """
-    discovered: List[tuple[str, str]] = []
-
-    if recursive:
-        for root, _, filenames in os.walk(directory):
-            for fname in filenames:
-                full_path = os.path.join(root, fname)
-                if os.path.isfile(full_path):
-                    rel_path = os.path.relpath(full_path, directory)
-                    discovered.append((rel_path, full_path))
-    else:
-        for fname in os.listdir(directory):
-            full_path = os.path.join(directory, fname)
-            if os.path.isfile(full_path):
-                discovered.append((fname, full_path))
-
-    # Apply pattern filter if provided
-    if pattern:
-        compiled = re.compile(pattern)
-        discovered = [(rel, full) for rel, full in discovered if compiled.search(rel)]
-
     ext_map = {
         ".prmtop": "prmtop",
         ".top": "prmtop",
@@ -1301,16 +1345,24 @@ def smart_group_files(
         ".x": "mdcrd",
     }
 
+    # Optional regex filter on the relative path
+    compiled = re.compile(pattern) if pattern else None
+
     # Group by stem
     grouped: Dict[str, Dict[str, str]] = {}
 
-    for rel_path, full_path in discovered:
-        stem = Path(rel_path).with_suffix("").as_posix()
+    for rel_path, entry in _scan_directory(directory, recursive):
         _, ext = os.path.splitext(rel_path)
         kind = ext_map.get(ext.lower())
-        if not kind:
+        # Cheap name checks first; is_file() is only asked for candidate names
+        if not kind or (compiled and not compiled.search(rel_path)) or not entry.is_file():
             continue
-        grouped.setdefault(stem, {})[kind] = full_path
+        # kind implies a non-empty ext, so slicing it off matches
+        # Path.with_suffix("") without building a Path per file
+        stem = rel_path[: -len(ext)]
+        if os.sep != "/":
+            stem = stem.replace(os.sep, "/")
+        grouped.setdefault(stem, {})[kind] = entry.path
 
     # Detect and handle numeric sequences
     all_stems = list(grouped.keys())
@@ -1327,6 +1379,96 @@ def smart_group_files(
     return grouped
 
 
+# Upper bound on threads used to parse discovered stages
+_DISCOVERY_WORKERS = 8
+
+# netCDF-C/HDF5 are not thread-safe, so files that may be NetCDF (trajectories and
+# restarts) are parsed one at a time even while stages are built concurrently
+_NETCDF_LOCK = threading.Lock()
+
+
+def _parse_serialized(parser_cls: Callable[[str], Any], path: str) -> Any:
+    with _NETCDF_LOCK:
+        return parser_cls(path).parse()
+
+
+def _parse_restart(path: str, cache: Optional[Dict[str, Any]]) -> Any:
+    """Parse a restart file, reusing an earlier parse of the same path in ``cache``.
+
+    One restart is often assigned to several stages (e.g. every production
+    window starting from the same equilibrated frame), so auto_discover keeps a
+    cache for the duration of the call. Lookups share the NetCDF lock, which
+    also makes the cache safe to use from the discovery thread pool.
+    """
+    with _NETCDF_LOCK:
+        if cache is None:
+            return InpcrdParser(path).parse()
+        data = cache.get(path)
+        if data is None:
+            data = cache[path] = InpcrdParser(path).parse()
+        return data
+
+
+# Only these kinds are read end to end by their parsers. Trajectories and
+# restarts are read for a header (and a few small variables), so asking the
+# kernel for the whole multi-GB file would just evict the page cache.
+_PREFETCH_KINDS = ("mdin", "mdout", "prmtop")
+
+
+def _prefetch_files(paths: List[str]) -> None:
+    """Ask the kernel to start reading ``paths`` in the background.
+
+    ``posix_fadvise(WILLNEED)`` queues readahead for every file up front, so cold
+    reads are already in flight when the parsers open them. Callers pass only
+    files that are parsed in full (see ``_PREFETCH_KINDS``). No-op where the call
+    is unavailable (e.g. Windows, macOS).
+    """
+    fadvise = getattr(os, "posix_fadvise", None)
+    if fadvise is None:
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue  # Reported by the parser that needs it
+        try:
+            fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_rule(pattern: str) -> Pattern[str]:
+    """Compile a grouping-rule pattern; strings that are not valid regexes match literally."""
+    try:
+        return re.compile(pattern)
+    except re.error:
+        return re.compile(re.escape(pattern))
+
+
+# Characters that give a grouping-rule pattern regex meaning beyond a literal
+_REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+
+
+@functools.lru_cache(maxsize=512)
+def _rule_matcher(pattern: str) -> Callable[[str], Any]:
+    """Return a stem predicate for a grouping rule.
+
+    Plain literals (``"CH3L1"``) and ``^``-anchored literals (``"^ntp_prod"``)
+    are answered with ``in`` / ``str.startswith`` without entering the regex
+    engine; anything else is searched with the compiled pattern.
+    """
+    anchored = pattern.startswith("^")
+    literal = pattern[1:] if anchored else pattern
+    if _REGEX_METACHARS.isdisjoint(literal):
+        if anchored:
+            return lambda stem: stem.startswith(literal)
+        return lambda stem: literal in stem
+    return _compile_rule(pattern).search
+
+
 def auto_discover(
     directory: str,
     manifest: Optional[Dict[str, Dict[str, str]] | List[Dict[str, str]]] = None,
@@ -1342,6 +1484,15 @@ def auto_discover(
     hmr_prmtop: Optional[str] = None,
     progress_callback: Optional[Callable[[str, int, int], None]] = None,
 ) -> SimulationProtocol:
+    # Allow-lists become sets once so each filter check is O(1) however long they
+    # are; roles are interned wherever they are assigned, so matches compare by identity
+    if include_roles:
+        include_roles = frozenset(_intern_str(role) for role in include_roles)
+    if include_stems:
+        include_stems = frozenset(include_stems)
+    # Restart files parsed during this call, by path (see _parse_restart)
+    restart_cache: Dict[str, Any] = {}
+
     if manifest is not None:
         stages = _manifest_to_stages(
             manifest,
@@ -1350,14 +1501,15 @@ def auto_discover(
             include_stems=include_stems,
             restart_files=restart_files,
             progress_callback=progress_callback,
+            restart_cache=restart_cache,
         )
         # Apply auto restart detection if requested
         if auto_detect_restarts:
-            auto_restarts = auto_detect_restart_chain(stages, directory)
+            auto_restarts = auto_detect_restart_chain(stages, directory, restart_cache)
             for stage in stages:
                 if stage.name in auto_restarts and not stage.restart_path:
                     rst_path = auto_restarts[stage.name]
-                    stage.inpcrd = InpcrdParser(rst_path).parse()
+                    stage.inpcrd = _parse_restart(rst_path, restart_cache)
                     stage.restart_path = rst_path
                     stage.validation.append(f"INFO: restart file auto-detected: {rst_path}")
 
@@ -1395,27 +1547,33 @@ def auto_discover(
     # Use smart grouping for file discovery
     grouped = smart_group_files(directory, pattern=pattern_filter, recursive=recursive)
 
-    compiled_rules: List[tuple[Pattern[str], str]] = []
-    if grouping_rules:
-        for pattern, role in grouping_rules.items():
-            try:
-                compiled_rules.append((re.compile(pattern), role))
-            except re.error:
-                compiled_rules.append((re.compile(re.escape(pattern)), role))
+    # One predicate per rule in rule order (first match wins): literal rules skip
+    # the regex engine, and CPython's sre keeps its literal-prefix scan for each
+    # remaining pattern, which a single combined alternation would lose
+    rule_searches: List[tuple[Callable[[str], Any], str]] = [
+        (_rule_matcher(pattern), _intern_str(role)) for pattern, role in (grouping_rules or {}).items()
+    ]
+
+    def rule_role(stem: str) -> Optional[str]:
+        for search, role in rule_searches:
+            if search(stem):
+                return role
+        return None
 
-    stages: List[SimulationStage] = []
-    for stem, kinds in sorted(grouped.items()):
-        # Skip internal metadata keys
-        file_kinds = {k: v for k, v in kinds.items() if not k.startswith("_")}
+    def filtered_out(stem: str, stage_role: Optional[str]) -> bool:
+        if include_stems and stem not in include_stems:
+            return True
+        # A rule-assigned role is final, so the role filter can run before any parsing
+        return bool(include_roles and stage_role and stage_role not in include_roles)
 
-        stage_role: Optional[str] = None
-        for pattern, role in compiled_rules:
-            if pattern.search(stem):
-                stage_role = role
-                break
+    def build_stage(stem: str, kinds: Dict[str, str]) -> Optional[SimulationStage]:
+        """Parse one discovered stem into a stage, or None if a filter drops it."""
+        stage_role = rule_role(stem)
+        if filtered_out(stem, stage_role):
+            return None
 
-        if include_stems and stem not in include_stems:
-            continue
+        # Skip internal metadata keys
+        file_kinds = {k: v for k, v in kinds.items() if not k.startswith("_")}
 
         stage = SimulationStage(name=stem, stage_role=stage_role)
 
@@ -1428,41 +1586,41 @@ def auto_discover(
                 f"INFO: Part of sequence '{seq_base}' (item {int(seq_idx)+1} of {seq_len})"
             )
 
-        if "prmtop" in file_kinds:
-            stage.prmtop = PrmtopParser(file_kinds["prmtop"]).parse()
+        # Only mdin/mdout feed role inference; the other files are parsed once the
+        # stage has passed the role filter below
         if "mdin" in file_kinds:
             stage.mdin = MdinParser(file_kinds["mdin"]).parse()
             # Try mdin-based inference first
-            inferred_role = getattr(stage.mdin.details, "stage_role", None)
+            inferred_role = _intern_str(getattr(stage.mdin.details, "stage_role", None))
             if not stage.stage_role and inferred_role:
                 stage.stage_role = inferred_role
                 stage.validation.append(f"INFO: stage_role '{inferred_role}' inferred from mdin file")
         if "mdout" in file_kinds:
             stage.mdout = MdoutParser(file_kinds["mdout"]).parse()
-        if "mdcrd" in file_kinds:
-            stage.mdcrd = MdcrdParser(file_kinds["mdcrd"]).parse()
-        if "inpcrd" in file_kinds:
-            stage.inpcrd = InpcrdParser(file_kinds["inpcrd"]).parse()
-            stage.restart_path = file_kinds["inpcrd"]
 
         # Try content-based role inference if still no role
         if not stage.stage_role:
-            inferred = infer_stage_role_from_content(stage.mdin, stage.mdout)
+            inferred = _intern_str(infer_stage_role_from_content(stage.mdin, stage.mdout))
             if inferred:
                 stage.stage_role = inferred
                 stage.validation.append(f"INFO: stage_role '{inferred}' inferred from file content")
 
         # Try path-based role inference as final fallback
         if not stage.stage_role:
-            inferred = infer_stage_role_from_path(stem)
+            inferred = _intern_str(infer_stage_role_from_path(stem))
             if inferred:
                 stage.stage_role = inferred
                 stage.validation.append(f"INFO: stage_role '{inferred}' inferred from path")
 
         if include_roles and stage.stage_role and stage.stage_role not in include_roles:
-            continue
+            return None
         if include_roles and not stage.stage_role:
-            continue
+            return None
+
+        if "prmtop" in file_kinds:
+            stage.prmtop = PrmtopParser(file_kinds["prmtop"]).parse()
+        if "mdcrd" in file_kinds:
+            stage.mdcrd = _parse_serialized(MdcrdParser, file_kinds["mdcrd"])
 
         restart_source = None
         if restart_files:
@@ -1471,19 +1629,40 @@ def auto_discover(
                     restart_source = restart_files[key]
                     break
 
+        # An explicit restart replaces the discovered inpcrd, which is then never read
         if restart_source:
-            stage.inpcrd = InpcrdParser(restart_source).parse()
+            stage.inpcrd = _parse_restart(restart_source, restart_cache)
             stage.restart_path = restart_source
+        elif "inpcrd" in file_kinds:
+            stage.inpcrd = _parse_restart(file_kinds["inpcrd"], restart_cache)
+            stage.restart_path = file_kinds["inpcrd"]
 
-        stages.append(stage)
+        return stage
+
+    # Stems are independent: overlap their file reads in a thread pool. map() keeps
+    # the sorted stem order, and an exception surfaces for the first failing stem
+    items = sorted(grouped.items())
+    if len(items) > 1:
+        _prefetch_files([
+            kinds[kind]
+            for stem, kinds in items
+            if not filtered_out(stem, rule_role(stem))
+            for kind in _PREFETCH_KINDS
+            if kind in kinds
+        ])
+        with ThreadPoolExecutor(max_workers=min(_DISCOVERY_WORKERS, len(items))) as pool:
+            built = list(pool.map(lambda item: build_stage(*item), items))
+    else:
+        built = [build_stage(stem, kinds) for stem, kinds in items]
+    stages: List[SimulationStage] = [stage for stage in built if stage is not None]
 
     # Apply auto restart detection if requested
     if auto_detect_restarts:
-        auto_restarts = auto_detect_restart_chain(stages, directory)
+        auto_restarts = auto_detect_restart_chain(stages, directory, restart_cache)
         for stage in stages:
             if stage.name in auto_restarts and not stage.restart_path:
                 rst_path = auto_restarts[stage.name]
-                stage.inpcrd = InpcrdParser(rst_path).parse()
+                stage.inpcrd = _parse_restart(rst_path, restart_cache)
                 stage.restart_path = rst_path
                 stage.validation.append(f"INFO: restart file auto-detected: {rst_path}")
 
@@ -1508,6 +1687,9 @@ def _expand_env_vars(value: Any) -> Any:
     Supports ${VAR} and $VAR syntax. Undefined variables are left unchanged.
     """
     if isinstance(value, str):
+        # Both forms need a '$'; most paths have none
+        if "$" not in value:
+            return value
         # Expand ${VAR} syntax
         result = value
         import re
@@ -1590,6 +1772,44 @@ def _parse_toml_manifest(text: str) -> Dict[str, Any] | List[Dict[str, Any]]:
     return data
 
 
+# Parsed manifests keyed by (absolute path, mtime_ns, size), oldest evicted first
+_MANIFEST_CACHE: Dict[tuple, Any] = {}
+_MANIFEST_CACHE_SIZE = 32
+
+# Cached stand-in for files that parse to nothing (e.g. an empty YAML document)
+_EMPTY_MANIFEST = object()
+
+
+def _parse_manifest_file(path: Path) -> Any:
+    data = path.read_bytes()
+    suffix = path.suffix.lower()
+    if suffix not in {".yaml", ".yml", ".toml", ".csv"} and orjson is not None:
+        # orjson parses the raw bytes directly; anything it rejects (e.g. NaN
+        # literals) goes through the stdlib parser below for the usual result
+        try:
+            manifest = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+        else:
+            return _EMPTY_MANIFEST if manifest is None else manifest
+
+    text = data.decode("utf-8")
+
+    if suffix in {".yaml", ".yml"}:
+        if yaml is None:
+            raise ImportError("PyYAML is required to read YAML manifests. Install with `pip install pyyaml`.")
+        manifest = yaml.safe_load(text)
+    elif suffix == ".toml":
+        manifest = _parse_toml_manifest(text)
+    elif suffix == ".csv":
+        manifest = _parse_csv_manifest(text)
+    else:
+        # Default to JSON
+        manifest = json.loads(text)
+
+    return _EMPTY_MANIFEST if manifest is None else manifest
+
+
 def load_manifest(
     manifest_path: str | os.PathLike[str],
     expand_env: bool = True,
@@ -1611,35 +1831,31 @@ def load_manifest(
     """
 
     path = Path(manifest_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Manifest not found: {manifest_path}")
-
-    text = path.read_text(encoding="utf-8")
-    suffix = path.suffix.lower()
-
-    if suffix in {".yaml", ".yml"}:
-        if yaml is None:
-            raise ImportError("PyYAML is required to read YAML manifests. Install with `pip install pyyaml`.")
-        manifest = yaml.safe_load(text)
-    elif suffix == ".toml":
-        manifest = _parse_toml_manifest(text)
-    elif suffix == ".csv":
-        manifest = _parse_csv_manifest(text)
-    else:
-        # Default to JSON
-        manifest = json.loads(text)
+    try:
+        st = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(f"Manifest not found: {manifest_path}") from None
 
+    # Parsed manifests are memoized on the file's signature; an edited file misses
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    manifest = _MANIFEST_CACHE.get(key)
     if manifest is None:
+        manifest = _parse_manifest_file(path)
+        if len(_MANIFEST_CACHE) >= _MANIFEST_CACHE_SIZE:
+            _MANIFEST_CACHE.pop(next(iter(_MANIFEST_CACHE)))
+        _MANIFEST_CACHE[key] = manifest
+
+    if manifest is _EMPTY_MANIFEST:
         return {}
 
     if not isinstance(manifest, (dict, list)):
         raise TypeError("Manifest must be a mapping or list of stage entries.")
 
-    # Expand environment variables if requested
+    # Callers get their own containers: env expansion rebuilds them, otherwise copy.
+    # Expansion runs per call, so it always sees the current environment.
     if expand_env:
-        manifest = _expand_env_vars(manifest)
-
-    return manifest
+        return _expand_env_vars(manifest)
+    return copy.deepcopy(manifest)
 
 
 def load_protocol_from_manifest(
@@ -1995,9 +2211,14 @@ class ProtocolBuilder:
                 stage.expected_gap_ps = expected
                 stage.gap_tolerance_ps = tolerance
 
-        # Validate now with proper tolerances applied
+        # Validate now with proper tolerances applied. Discovered stages were
+        # already checked individually by auto_discover, so only the
+        # continuity pass is left for them.
         if not self._skip_cross_stage_validation:
-            protocol.validate(cross_stage=True)
+            if self._stages:
+                protocol.validate(cross_stage=True)
+            else:
+                protocol._check_continuity()
 
         return protocol
 
@@ -81,11 +81,13 @@ which can be shared between TUI and GUI implementations.
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 import re
+import stat
 from dataclasses import dataclass, field
-from pathlib import Path
+from pathlib import Path, PurePath
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 try:
@@ -159,8 +161,13 @@ STAGE_ROLES = ["minimization", "heating", "equilibration", "production"]
 
 def get_file_type(path: str) -> Optional[str]:
     """Determine the file type based on extension."""
-    ext = Path(path).suffix.lower()
-    name = Path(path).name.lower()
+    return _file_type_for_name(os.path.basename(path.rstrip(os.sep)).lower())
+
+
+@functools.lru_cache(maxsize=4096)
+def _file_type_for_name(name: str) -> Optional[str]:
+    """Classify a lowercased file name (memoized; only the name matters)."""
+    ext = PurePath(name).suffix
 
     for file_type, extensions in FILE_EXTENSIONS.items():
         if ext in extensions:
@@ -171,6 +178,29 @@ def get_file_type(path: str) -> Optional[str]:
     return None
 
 
+def _parse_opt_float(value: str) -> Optional[float]:
+    """Parse an optional float field, returning None for blank or invalid input."""
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _parse_opt_seq_index(value: str) -> Optional[int]:
+    """Parse a 1-based sequence position into a 0-based index (None if unset/invalid)."""
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        index = int(value) - 1
+    except ValueError:
+        return None
+    return index if index >= 0 else None
+
+
 @dataclass
 class StageFile:
     """Represents a file assigned to a stage."""
@@ -222,6 +252,8 @@ class ProtocolState:
 
     def __init__(self, base_directory: str):
         self.base_directory = os.path.abspath(base_directory)
+        # Trailing-separator form for prefix checks in relpath()
+        self._base_prefix = os.path.join(self.base_directory, "")
         self.stages: List[Stage] = []
         self.global_prmtop: Optional[str] = None
         self.hmr_prmtop: Optional[str] = None
@@ -235,6 +267,9 @@ class ProtocolState:
         # File discovery cache
         self._discovered_files: Dict[str, Dict[str, str]] = {}
         self._sequences: Dict[str, List[str]] = {}
+        # Sequence member stem -> (discovery rank, base), and the distinct stem lengths
+        self._sequence_prefix_index: Dict[str, Tuple[int, str]] = {}
+        self._sequence_prefix_lengths: Tuple[int, ...] = ()
 
     def discover_files(self, recursive: bool = True) -> None:
         """Discover simulation files in the directory."""
@@ -246,6 +281,16 @@ class ProtocolState:
         # Extract sequence information
         stems = list(self._discovered_files.keys())
         self._sequences = detect_numeric_sequences(stems)
+        # Index basename stems so find_sequence() does a few dict probes per click
+        self._sequence_prefix_index = {}
+        for rank, (base, seq_stems) in enumerate(self._sequences.items()):
+            for s in seq_stems:
+                self._sequence_prefix_index.setdefault(
+                    s.rsplit("/", 1)[-1].rsplit(".", 1)[0], (rank, base)
+                )
+        self._sequence_prefix_lengths = tuple(
+            sorted({len(prefix) for prefix in self._sequence_prefix_index})
+        )
 
     def get_discovered_files(self) -> Dict[str, Dict[str, str]]:
         """Get discovered files grouped by stem."""
@@ -255,6 +300,33 @@ class ProtocolState:
         """Get detected numeric sequences."""
         return self._sequences
 
+    def find_sequence(self, stem: str) -> Optional[str]:
+        """Find the sequence whose member stems prefix ``stem``.
+
+        Returns the base pattern of the first matching sequence (in detection
+        order), or None if the stem does not belong to any sequence.
+        """
+        index = self._sequence_prefix_index
+        best: Optional[Tuple[int, str]] = None
+        for length in self._sequence_prefix_lengths:
+            if length > len(stem):
+                break
+            hit = index.get(stem[:length])
+            if hit is not None and (best is None or hit < best):
+                best = hit
+        return best[1] if best is not None else None
+
+    def relpath(self, path: str) -> str:
+        """Return ``path`` relative to the base directory.
+
+        Paths inside the base directory (the usual case) are handled by a
+        prefix strip; anything else falls back to ``os.path.relpath``.
+        """
+        abs_path = os.path.abspath(path)
+        if abs_path.startswith(self._base_prefix):
+            return abs_path[len(self._base_prefix):]
+        return os.path.relpath(abs_path, self.base_directory)
+
     def _save_state(self, description: str) -> None:
         """Save current state for undo."""
         state = UndoState(
@@ -818,6 +890,8 @@ if TEXTUAL_AVAILABLE:
         ):
             super().__init__(name=name, id=id, classes=classes)
             self.state = state
+            self._column_keys: List[Any] = []
+            self._rows: List[Tuple[str, str, str, str]] = []  # Cells currently displayed
 
         def compose(self) -> ComposeResult:
             yield DataTable(id="stage-table")
@@ -826,25 +900,45 @@ if TEXTUAL_AVAILABLE:
             table = self.query_one(DataTable)
             table.cursor_type = "row"
             # Seq = Sequence position (order within a numbered sequence like prod_001, prod_002)
-            table.add_columns("Stage Name", "Role", "Files", "Seq #")
+            self._column_keys = table.add_columns("Stage Name", "Role", "Files", "Seq #")
             self.refresh_stages()
 
+        @staticmethod
+        def _stage_row(stage: Stage) -> Tuple[str, str, str, str]:
+            """Build the table cells shown for a stage."""
+            seq_info = f"{stage.sequence_index+1}" if stage.sequence_index is not None else "-"
+            return (
+                stage.name[:30],
+                stage.role[:12] if stage.role else "-",
+                str(len(stage.files)),
+                seq_info,
+            )
+
         def refresh_stages(self) -> None:
-            """Refresh the stage list display."""
+            """Refresh the stage list display.
+
+            Rows are keyed by position, so only cells that changed are updated
+            and rows are added or removed at the end; moving or editing a stage
+            touches one or two rows instead of rebuilding the table.
+            """
             table = self.query_one(DataTable)
-            table.clear()
-
-            for idx, stage in enumerate(self.state.stages):
-                files_count = len(stage.files)
-                seq_info = f"{stage.sequence_index+1}" if stage.sequence_index is not None else "-"
-
-                table.add_row(
-                    stage.name[:30],
-                    stage.role[:12] if stage.role else "-",
-                    str(files_count),
-                    seq_info,
-                    key=str(idx),
-                )
+            new_rows = [self._stage_row(stage) for stage in self.state.stages]
+            old_rows = self._rows
+
+            for idx, (old, new) in enumerate(zip(old_rows, new_rows)):
+                if old == new:
+                    continue
+                for column_key, old_cell, new_cell in zip(self._column_keys, old, new):
+                    if old_cell != new_cell:
+                        table.update_cell(str(idx), column_key, new_cell, update_width=True)
+
+            for idx in range(len(old_rows) - 1, len(new_rows) - 1, -1):
+                table.remove_row(str(idx))
+
+            for idx in range(len(old_rows), len(new_rows)):
+                table.add_row(*new_rows[idx], key=str(idx))
+
+            self._rows = new_rows
 
         def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
             """Handle row selection."""
@@ -874,6 +968,7 @@ if TEXTUAL_AVAILABLE:
         ):
             super().__init__(name=name, id=id, classes=classes)
             self.stage = stage
+            self._file_inputs: Dict[str, Input] = {}
 
         def compose(self) -> ComposeResult:
             with Vertical(id="stage-editor-content"):
@@ -936,8 +1031,16 @@ if TEXTUAL_AVAILABLE:
                     yield Button("Clear", id="clear-stage", variant="default")
 
         def on_mount(self) -> None:
+            self._file_inputs = {
+                file_type: self.query_one(f"#file-{file_type}", Input)
+                for file_type in ["prmtop", "mdin", "mdout", "mdcrd", "inpcrd"]
+            }
             self.load_stage(self.stage)
 
+        def get_file_input(self, file_type: str) -> Input:
+            """Get the path input for a file type without a DOM query."""
+            return self._file_inputs[file_type]
+
         def load_stage(self, stage: Optional[Stage]) -> None:
             """Load a stage into the editor."""
             self.stage = stage
@@ -952,8 +1055,7 @@ if TEXTUAL_AVAILABLE:
             else:
                 role_select.value = Select.BLANK
 
-            for file_type in ["prmtop", "mdin", "mdout", "mdcrd", "inpcrd"]:
-                file_input = self.query_one(f"#file-{file_type}", Input)
+            for file_type, file_input in self._file_inputs.items():
                 file_input.value = stage.files.get(file_type, "") if stage else ""
 
             gap_input = self.query_one("#expected-gap", Input)
@@ -971,56 +1073,37 @@ if TEXTUAL_AVAILABLE:
         def get_stage(self) -> Optional[Stage]:
             """Get the stage from the editor fields."""
             name_input = self.query_one("#stage-name", Input)
-            if not name_input.value.strip():
+            name = name_input.value.strip()
+            if not name:
                 return None
 
             role_select = self.query_one("#stage-role", Select)
 
             files = {}
-            for file_type in ["prmtop", "mdin", "mdout", "mdcrd", "inpcrd"]:
-                file_input = self.query_one(f"#file-{file_type}", Input)
-                if file_input.value.strip():
-                    files[file_type] = file_input.value.strip()
+            for file_type, file_input in self._file_inputs.items():
+                file_path = file_input.value.strip()
+                if file_path:
+                    files[file_type] = file_path
 
             gap_input = self.query_one("#expected-gap", Input)
             tolerance_input = self.query_one("#gap-tolerance", Input)
             notes_input = self.query_one("#stage-notes", Input)
 
-            expected_gap = None
-            if gap_input.value.strip():
-                try:
-                    expected_gap = float(gap_input.value.strip())
-                except ValueError:
-                    pass
-
-            tolerance = None
-            if tolerance_input.value.strip():
-                try:
-                    tolerance = float(tolerance_input.value.strip())
-                except ValueError:
-                    pass
+            expected_gap = _parse_opt_float(gap_input.value)
+            tolerance = _parse_opt_float(tolerance_input.value)
 
-            notes = []
-            if notes_input.value.strip():
-                notes = [n.strip() for n in notes_input.value.split(";") if n.strip()]
+            notes = [n for n in (part.strip() for part in notes_input.value.split(";")) if n]
 
             # Get sequence info from inputs
             seq_base_input = self.query_one("#seq-base", Input)
             seq_index_input = self.query_one("#seq-index", Input)
 
             seq_base = seq_base_input.value.strip() or None
-            seq_index = None
-            if seq_index_input.value.strip():
-                try:
-                    # User enters 1-based, we store 0-based
-                    seq_index = int(seq_index_input.value.strip()) - 1
-                    if seq_index < 0:
-                        seq_index = None
-                except ValueError:
-                    pass
+            # User enters 1-based, we store 0-based
+            seq_index = _parse_opt_seq_index(seq_index_input.value)
 
             return Stage(
-                name=name_input.value.strip(),
+                name=name,
                 role=role_select.value if role_select.value != Select.BLANK else "",
                 files=files,
                 expected_gap_ps=expected_gap,
@@ -1094,7 +1177,24 @@ if TEXTUAL_AVAILABLE:
                     yield Button("Export", id="do-export", variant="primary")
                     yield Button("Cancel", id="cancel-export", variant="default")
 
-        def on_mount(self) -> None:
+        def reset(self, state: ProtocolState) -> None:
+            """Rebind to the current protocol state and restore the default inputs.
+
+            A reused instance would otherwise show the previous export's format,
+            filename and path type. Before the first compose there is nothing to reset.
+            """
+            self.state = state
+            if not self.is_mounted:
+                return
+            # The filename is reset below, so the extension rewrite must not run
+            with self.prevent(Select.Changed):
+                self.query_one("#export-format", Select).value = "yaml"
+            self.query_one("#export-filename", Input).value = "manifest.yaml"
+            # The RadioSet releases the other button when it handles the change
+            self.query_one("#abs-paths", RadioButton).value = True
+
+        def on_screen_resume(self) -> None:
+            # Runs on every push, so a reused instance previews the current stages
             self.update_preview()
             # Focus the filename input
             self.query_one("#export-filename", Input).focus()
@@ -1108,6 +1208,10 @@ if TEXTUAL_AVAILABLE:
                 filename_input.value = f"{base}.{event.value}"
             self.update_preview()
 
+        def on_radio_set_changed(self, event: RadioSet.Changed) -> None:
+            if event.radio_set.id == "path-type":
+                self.update_preview()
+
         def update_preview(self) -> None:
             """Update the export preview."""
             format_select = self.query_one("#export-format", Select)
@@ -1231,9 +1335,17 @@ if TEXTUAL_AVAILABLE:
                     yield Button("Apply", id="apply-settings", variant="primary")
                     yield Button("Cancel", id="cancel-settings", variant="default")
 
-        def on_mount(self) -> None:
-            """Focus the first input on mount."""
-            self.query_one("#global-prmtop", Input).focus()
+        def reset(self, state: ProtocolState) -> None:
+            """Rebind to the current protocol state before the modal is re-shown."""
+            self.state = state
+
+        def on_screen_resume(self) -> None:
+            """Load the current settings and focus the first input."""
+            prmtop_input = self.query_one("#global-prmtop", Input)
+            prmtop_input.value = self.state.global_prmtop or ""
+            self.query_one("#hmr-prmtop", Input).value = self.state.hmr_prmtop or ""
+            self.query_one("#auto-restart", RadioButton).value = self.state.auto_link_restarts
+            prmtop_input.focus()
 
         def on_button_pressed(self, event: Button.Pressed) -> None:
             if event.button.id == "apply-settings":
@@ -1338,6 +1450,8 @@ if TEXTUAL_AVAILABLE:
             self.folder_path = folder_path
             self.selected_stems: Set[str] = set()
             self._stem_info: List[Tuple[str, Dict[str, str], str]] = []
+            self._id_to_stem: Dict[str, str] = {}
+            self._discovered: Dict[str, Dict[str, str]] = {}
 
         def compose(self) -> ComposeResult:
             with Container(id="folder-modal"):
@@ -1383,6 +1497,8 @@ if TEXTUAL_AVAILABLE:
                     yield Button("Cancel", id="cancel-folder", variant="error")
 
         def on_mount(self) -> None:
+            # Snapshot once; files added on disk show up when the modal is reopened.
+            self._discovered = self.state.get_discovered_files()
             self._populate_stems()
             self._update_stats()
 
@@ -1390,10 +1506,11 @@ if TEXTUAL_AVAILABLE:
             """Populate the stem list with discovered file groups."""
             container = self.query_one("#stem-list", Vertical)
 
-            discovered = self.state.get_discovered_files()
+            discovered = self._discovered
             existing_names = {s.name for s in self.state.stages}
 
             self._stem_info = []
+            self._id_to_stem = {}
 
             for stem, files in sorted(discovered.items()):
                 # Get file types in this group (excluding metadata keys)
@@ -1427,9 +1544,11 @@ if TEXTUAL_AVAILABLE:
                 files_str = ", ".join(sorted(file_types))
                 role_str = f"[{inferred_role}]" if inferred_role else "[dim]no role[/]"
 
+                checkbox_id = f"stem-{stem.replace('/', '_').replace('.', '_')}"
+                self._id_to_stem[checkbox_id] = stem
                 checkbox = RadioButton(
                     f"{stem[:40]} ({files_str}) {role_str}",
-                    id=f"stem-{stem.replace('/', '_').replace('.', '_')}",
+                    id=checkbox_id,
                     value=False,
                 )
                 container.mount(checkbox)
@@ -1462,22 +1581,18 @@ if TEXTUAL_AVAILABLE:
 
         def on_radio_button_changed(self, event: RadioButton.Changed) -> None:
             """Handle checkbox changes."""
-            if event.radio_button.id and event.radio_button.id.startswith("stem-"):
-                stem_key = event.radio_button.id[5:].replace("_", "/").replace("_", ".")
-                # Find the actual stem
-                for stem, _, _ in self._stem_info:
-                    if stem.replace("/", "_").replace(".", "_") == event.radio_button.id[5:]:
-                        if event.value:
-                            self.selected_stems.add(stem)
-                        else:
-                            self.selected_stems.discard(stem)
-                        break
-                self._update_stats()
+            stem = self._id_to_stem.get(event.radio_button.id or "")
+            if stem is None:
+                return
+            if event.value:
+                self.selected_stems.add(stem)
+            else:
+                self.selected_stems.discard(stem)
+            self._update_stats()
 
         def action_select_all(self) -> None:
             """Select all stems."""
-            for stem, _, _ in self._stem_info:
-                self.selected_stems.add(stem)
+            self.selected_stems.update(stem for stem, _, _ in self._stem_info)
             self._refresh_checkboxes()
             self._update_stats()
 
@@ -1488,14 +1603,18 @@ if TEXTUAL_AVAILABLE:
             self._update_stats()
 
         def _refresh_checkboxes(self) -> None:
-            """Refresh checkbox states."""
-            for stem, _, _ in self._stem_info:
-                checkbox_id = f"stem-{stem.replace('/', '_').replace('.', '_')}"
-                try:
-                    checkbox = self.query_one(f"#{checkbox_id}", RadioButton)
-                    checkbox.value = stem in self.selected_stems
-                except Exception:
-                    pass
+            """Refresh checkbox states.
+
+            ``selected_stems`` is already up to date here, so the per-checkbox
+            change events are suppressed; callers update the stats once.
+            """
+            with self.prevent(RadioButton.Changed):
+                for checkbox_id, stem in self._id_to_stem.items():
+                    try:
+                        checkbox = self.query_one(f"#{checkbox_id}", RadioButton)
+                        checkbox.value = stem in self.selected_stems
+                    except Exception:
+                        pass
 
         def on_button_pressed(self, event: Button.Pressed) -> None:
             if event.button.id == "select-all":
@@ -1552,7 +1671,7 @@ if TEXTUAL_AVAILABLE:
             self.prmtop_path = prmtop_path
 
         def compose(self) -> ComposeResult:
-            rel_path = os.path.relpath(self.prmtop_path, self.state.base_directory)
+            rel_path = self.state.relpath(self.prmtop_path)
             with Container(id="prmtop-modal"):
                 yield Label("Assign Topology File", id="prmtop-title")
                 yield Rule()
@@ -1584,7 +1703,7 @@ if TEXTUAL_AVAILABLE:
                 yield Button("Cancel", id="cancel-prmtop", variant="error")
 
         def on_button_pressed(self, event: Button.Pressed) -> None:
-            rel_path = os.path.relpath(self.prmtop_path, self.state.base_directory)
+            rel_path = self.state.relpath(self.prmtop_path)
             if event.button.id == "assign-global":
                 self.state.global_prmtop = rel_path
                 self.dismiss("global")
@@ -1617,6 +1736,8 @@ if TEXTUAL_AVAILABLE:
             super().__init__(name=name, id=id, classes=classes)
             self.state = state
             self.results: List[str] = []
+            # (stem, lowercased stem, files) captured once in on_mount
+            self._entries: List[Tuple[str, str, Dict[str, str]]] = []
 
         def compose(self) -> ComposeResult:
             with Container(id="search-modal"):
@@ -1647,7 +1768,21 @@ if TEXTUAL_AVAILABLE:
                     yield Button("Select", id="select-result", variant="primary")
                     yield Button("Close", id="close-search", variant="default")
 
-        def on_mount(self) -> None:
+        def reset(self, state: ProtocolState) -> None:
+            """Rebind to the current protocol state before the modal is re-shown."""
+            self.state = state
+
+        def on_screen_resume(self) -> None:
+            # Snapshot once per opening; files added on disk show up when the modal is reopened.
+            self._entries = [
+                (stem, stem.lower(), files)
+                for stem, files in self.state.get_discovered_files().items()
+            ]
+            search_input = self.query_one("#search-input", Input)
+            with self.prevent(Input.Changed, Select.Changed):
+                search_input.value = ""
+                self.query_one("#type-filter", Select).value = "all"
+            search_input.focus()
             self.update_results()
 
         def on_input_changed(self, event: Input.Changed) -> None:
@@ -1670,8 +1805,8 @@ if TEXTUAL_AVAILABLE:
             results_list.clear_options()
             self.results = []
 
-            for stem, files in self.state.get_discovered_files().items():
-                if pattern and pattern not in stem.lower():
+            for stem, stem_lower, files in self._entries:
+                if pattern and pattern not in stem_lower:
                     continue
 
                 for ftype, path in files.items():
@@ -1705,252 +1840,7 @@ if TEXTUAL_AVAILABLE:
         TITLE = "AmberMeta Protocol Builder"
         SUB_TITLE = "Interactive Manifest Creator"
 
-        CSS = """
-        Screen {
-            layout: grid;
-            grid-size: 2 1;
-            grid-columns: 1fr 2fr;
-        }
-
-        #left-panel {
-            width: 100%;
-            height: 100%;
-            min-width: 30;
-            border: solid green;
-        }
-
-        #right-panel {
-            width: 100%;
-            height: 100%;
-            min-width: 50;
-            layout: vertical;
-        }
-
-        #file-tree {
-            height: 100%;
-            min-width: 25;
-        }
-
-        #stage-panel {
-            height: 50%;
-            min-height: 10;
-            border: solid blue;
-        }
-
-        #stage-header {
-            text-align: center;
-            text-style: bold;
-            background: $primary-darken-2;
-            padding: 0 1;
-        }
-
-        #editor-panel {
-            height: 50%;
-            min-height: 15;
-            border: solid cyan;
-            overflow-y: auto;
-        }
-
-        #stage-table {
-            height: 100%;
-            min-width: 40;
-        }
-
-        .editor-row {
-            height: 3;
-            margin: 0 1;
-        }
-
-        .editor-row Label {
-            width: 18;
-            min-width: 15;
-        }
-
-        .editor-row Input {
-            width: 1fr;
-            min-width: 20;
-        }
-
-        .editor-row Select {
-            width: 1fr;
-            min-width: 20;
-        }
-
-        .section-label {
-            margin-top: 1;
-            text-style: bold;
-        }
-
-        .file-label {
-            width: 15;
-        }
-
-        .button-row {
-            height: 3;
-            margin-top: 1;
-            align: center middle;
-        }
-
-        .button-row Button {
-            margin: 0 1;
-        }
-
-        #editor-title {
-            text-align: center;
-            text-style: bold;
-        }
-
-        /* Modal styles */
-        ModalScreen {
-            align: center middle;
-        }
-
-        #export-modal, #settings-modal, #sequence-modal, #search-modal, #prmtop-modal, #folder-modal {
-            width: 80%;
-            height: auto;
-            max-height: 90%;
-            min-width: 60;
-            border: thick $primary;
-            background: $surface;
-            padding: 1 2;
-        }
-
-        #export-title, #settings-title, #seq-title, #search-title, #prmtop-title, #folder-title {
-            text-align: center;
-            text-style: bold;
-            margin-bottom: 1;
-        }
-
-        .export-row, .settings-row, .seq-row, .search-row {
-            height: 3;
-            margin: 0 1;
-        }
-
-        .export-row Label, .settings-row Label, .seq-row Label, .search-row Label {
-            width: auto;
-            min-width: 25;
-        }
-
-        .export-row Input, .settings-row Input {
-            width: 1fr;
-        }
-
-        /* Prmtop assignment modal */
-        #prmtop-options {
-            margin: 1 0;
-        }
-
-        #prmtop-options Button {
-            width: 100%;
-            margin: 1 0;
-        }
-
-        .prmtop-path {
-            color: $text-muted;
-            margin-bottom: 1;
-        }
-
-        /* RadioSet and RadioButton fixes */
-        RadioSet {
-            width: 100%;
-            height: auto;
-            layout: vertical;
-        }
-
-        RadioButton {
-            width: 100%;
-            min-width: 40;
-            padding: 0 1;
-        }
-
-        .path-options {
-            height: auto;
-            margin: 1 0;
-        }
-
-        .path-options RadioSet {
-            width: 100%;
-        }
-
-        /* Input labels that appear above inputs */
-        .input-label {
-            margin-top: 1;
-            text-style: bold;
-            width: 100%;
-        }
-
-        .help-text {
-            margin: 1 0;
-        }
-
-        .checkbox-row {
-            height: auto;
-            margin: 1 0;
-        }
-
-        /* Improve Select width in modals */
-        #export-modal Select, #settings-modal Select, #folder-modal Select {
-            width: 100%;
-        }
-
-        #export-modal Input, #settings-modal Input, #folder-modal Input {
-            width: 100%;
-        }
-
-        /* Auto-generate modal */
-        #stem-list-container {
-            height: 1fr;
-            min-height: 10;
-            max-height: 40;
-            border: solid $primary-darken-2;
-            margin: 1 0;
-            overflow-y: auto;
-        }
-
-        #stem-list {
-            padding: 1;
-            height: auto;
-        }
-
-        #stem-list RadioButton {
-            width: 100%;
-            height: auto;
-            margin: 0;
-        }
-
-        .folder-stats {
-            height: 2;
-            margin: 1 0;
-        }
-
-        .folder-stats Static {
-            width: 50%;
-        }
-
-        /* Help text */
-        .help-text-small {
-            color: $text-muted;
-            margin: 0 1;
-            height: 2;
-        }
-
-        #preview-container, #seq-list-container, #results-container {
-            height: 15;
-            border: solid $primary-darken-2;
-            margin: 1 0;
-        }
-
-        #export-preview {
-            padding: 1;
-        }
-
-        /* Status bar */
-        #status-bar {
-            dock: bottom;
-            height: 1;
-            background: $primary-darken-2;
-        }
-        """
+        CSS_PATH = "tui.tcss"
 
         BINDINGS = [
             Binding("ctrl+q", "quit", "Quit"),
@@ -1978,6 +1868,7 @@ if TEXTUAL_AVAILABLE:
             self.current_stage_index: int = -1
             self._pending_prmtop_path: Optional[str] = None  # For stage prmtop assignment
             self._current_folder_context: Optional[str] = None  # Track selected folder for Ctrl+A
+            self._refresh_pending = False  # Stage list refresh queued for next frame
 
         def compose(self) -> ComposeResult:
             yield Header()
@@ -1997,6 +1888,8 @@ if TEXTUAL_AVAILABLE:
 
         async def on_mount(self) -> None:
             """Initialize the application."""
+            # Kept so deferred refreshes still find it while a modal is on top
+            self._stage_list = self.query_one("#stage-list", StageList)
             self.notify("Discovering simulation files...")
             self.state.discover_files(recursive=True)
 
@@ -2033,14 +1926,22 @@ if TEXTUAL_AVAILABLE:
             if event.node.data:
                 path = Path(event.node.data)
 
+                # A single stat() serves both the folder and the file branch
+                try:
+                    mode = os.stat(path).st_mode
+                except OSError:
+                    return
+                is_dir = stat.S_ISDIR(mode)
+                is_file = stat.S_ISREG(mode)
+
                 # Track folder context for Ctrl+A - use parent if file, else use folder
-                if path.is_dir():
+                if is_dir:
                     self._current_folder_context = str(path)
-                elif path.is_file():
+                elif is_file:
                     self._current_folder_context = str(path.parent)
 
                 # Folder selection
-                if path.is_dir():
+                if is_dir:
                     has_sims, prmtop_files = self._folder_has_simulation_files(str(path))
 
                     if has_sims:
@@ -2064,7 +1965,7 @@ if TEXTUAL_AVAILABLE:
                         self.notify("No simulation or topology files found in this folder")
                     return
 
-                if path.is_file():
+                if is_file:
                     file_type = get_file_type(str(path))
 
                     # Special handling for prmtop files - offer global assignment
@@ -2076,21 +1977,23 @@ if TEXTUAL_AVAILABLE:
                         )
                         return
 
+                    sequences = self.state.get_sequences()
+                    discovered = self.state.get_discovered_files()
+
                     # Check if this is part of a sequence
-                    stem = path.stem
-                    for base, stems in self.state.get_sequences().items():
-                        if any(stem.startswith(s.rsplit("/", 1)[-1].rsplit(".", 1)[0]) for s in stems):
-                            self.push_screen(
-                                SequenceModal(self.state, base, stems),
-                                self.on_sequence_created
-                            )
-                            return
+                    base = self.state.find_sequence(path.stem)
+                    if base is not None:
+                        self.push_screen(
+                            SequenceModal(self.state, base, sequences[base]),
+                            self.on_sequence_created
+                        )
+                        return
 
                     # Create single stage
-                    rel_path = os.path.relpath(str(path), self.state.base_directory)
-                    stem_path = str(Path(rel_path).with_suffix(""))
+                    rel_path = self.state.relpath(event.node.data)
+                    stem_path = os.path.splitext(rel_path)[0]
 
-                    if stem_path in self.state.get_discovered_files():
+                    if stem_path in discovered:
                         stage = self.state.create_stage_from_stem(stem_path)
                         if stage:
                             self.refresh_stages()
@@ -2099,7 +2002,7 @@ if TEXTUAL_AVAILABLE:
                         # Manual file assignment
                         if file_type:
                             editor = self.query_one("#stage-editor", StageEditor)
-                            file_input = editor.query_one(f"#file-{file_type}", Input)
+                            file_input = editor.get_file_input(file_type)
                             file_input.value = rel_path
                             self.notify(f"Set {file_type}: {rel_path}")
 
@@ -2118,11 +2021,9 @@ if TEXTUAL_AVAILABLE:
             elif result == "stage":
                 # Set in stage editor
                 if self._pending_prmtop_path:
-                    rel_path = os.path.relpath(
-                        self._pending_prmtop_path, self.state.base_directory
-                    )
+                    rel_path = self.state.relpath(self._pending_prmtop_path)
                     editor = self.query_one("#stage-editor", StageEditor)
-                    file_input = editor.query_one("#file-prmtop", Input)
+                    file_input = editor.get_file_input("prmtop")
                     file_input.value = rel_path
                     self.notify(f"Set stage prmtop: {rel_path}")
             self._pending_prmtop_path = None
@@ -2145,9 +2046,32 @@ if TEXTUAL_AVAILABLE:
                 self.notify(f"Added stage: {message.stage.name}")
 
         def refresh_stages(self) -> None:
-            """Refresh the stage list display."""
-            stage_list = self.query_one("#stage-list", StageList)
-            stage_list.refresh_stages()
+            """Schedule a refresh of the stage list display.
+
+            Refreshes requested within the same tick are coalesced, so handlers
+            that mutate several stages at once only rebuild the table once.
+            """
+            if not self._refresh_pending:
+                self._refresh_pending = True
+                self.call_after_refresh(self._do_refresh_stages)
+
+        def _do_refresh_stages(self) -> None:
+            """Run a pending stage list refresh."""
+            if self._refresh_pending:
+                self._refresh_pending = False
+                self._stage_list.refresh_stages()
+
+        def _get_modal(self, name: str, modal_class: Callable[[ProtocolState], ModalScreen]) -> ModalScreen:
+            """Return the installed instance of a reusable modal, creating it on first use.
+
+            Installed screens stay mounted when dismissed, so later openings skip
+            composing and styling the widget tree again.
+            """
+            if not self.is_screen_installed(name):
+                self.install_screen(modal_class(self.state), name)
+            modal = self.get_screen(name)
+            modal.reset(self.state)
+            return modal
 
         def action_quit(self) -> None:
             """Quit the application."""
@@ -2158,7 +2082,7 @@ if TEXTUAL_AVAILABLE:
             if not self.state.stages:
                 self.notify("No stages to export", severity="warning")
                 return
-            self.push_screen(ExportModal(self.state), self.on_export_complete)
+            self.push_screen(self._get_modal("export", ExportModal), self.on_export_complete)
 
         def on_export_complete(self, result: Optional[str]) -> None:
             """Handle export completion."""
@@ -2167,11 +2091,11 @@ if TEXTUAL_AVAILABLE:
 
         def action_global_settings(self) -> None:
             """Open global settings modal."""
-            self.push_screen(GlobalSettingsModal(self.state))
+            self.push_screen(self._get_modal("global-settings", GlobalSettingsModal))
 
         def action_search(self) -> None:
             """Open search modal."""
-            self.push_screen(SearchModal(self.state), self.on_search_result)
+            self.push_screen(self._get_modal("search", SearchModal), self.on_search_result)
 
         def action_auto_generate(self) -> None:
             """Open auto-generate stages modal, scoped to current folder context if available."""
@@ -2189,11 +2113,11 @@ if TEXTUAL_AVAILABLE:
         def on_search_result(self, result: Optional[str]) -> None:
             """Handle search result selection."""
             if result:
-                rel_path = os.path.relpath(result, self.state.base_directory)
+                rel_path = self.state.relpath(result)
                 file_type = get_file_type(result)
                 if file_type:
                     editor = self.query_one("#stage-editor", StageEditor)
-                    file_input = editor.query_one(f"#file-{file_type}", Input)
+                    file_input = editor.get_file_input(file_type)
                     file_input.value = rel_path
                     self.notify(f"Selected {file_type}: {rel_path}")
 
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import functools
 import math
 import os
 import re
 import statistics
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore
 
 HAS_NETCDF = False
 NETCDF_BACKEND = "None"
@@ -25,22 +32,54 @@ except ImportError:  # pragma: no cover - optional dependency
         nc = None  # type: ignore
 
 
-@dataclass
+# Matches "Key = Value" or "Key=Value"; keys can contain (), -, . and /
+_KV_RE = re.compile(r"([A-Za-z0-9_\-\(\)\./]+)\s*=\s*([-\d\.\*]+)")
+
+# Numeric token classifiers (used with fullmatch)
+_INT_RE = re.compile(r"[-+]?\d+")
+_FLOAT_RE = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_FORTRAN_FLOAT_RE = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eEdD][-+]?\d+)?")
+# NaN/Inf spellings float() accepts but the numeric patterns above do not
+_NONFINITE_TOKENS = frozenset(
+    sign + word for sign in ("", "+", "-") for word in ("nan", "inf", "infinity")
+)
+_NUMERIC_START = frozenset("+-.0123456789")
+
+# Whitespace, trailing commas and quotes stripped from namelist values in one pass
+_VALUE_STRIP_CHARS = " \t\r\n\f\v,\"'"
+
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class MetadataBase:
     filename: str
     warnings: List[str] = field(default_factory=list)
 
 
-def _detect_format(filepath: str) -> str:
-    with open(filepath, "rb") as f:
-        header = f.read(4)
-        if header.startswith(b"CDF"):
-            return "NetCDF"
+@functools.lru_cache(maxsize=4096)
+def _detect_format_cached(filepath: str, inode: int, mtime_ns: int, size: int) -> str:
+    # Raw fd read: no buffered file object is needed for four bytes
+    fd = os.open(filepath, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        header = os.read(fd, 4)
+    finally:
+        os.close(fd)
+    if header.startswith(b"CDF"):
+        return "NetCDF"
     return "ASCII"
 
 
+def _detect_format(filepath: str) -> str:
+    # Keyed on the stat signature so rewritten files are sniffed again
+    st = os.stat(filepath)
+    return _detect_format_cached(filepath, st.st_ino, st.st_mtime_ns, st.st_size)
+
+
 def _clean_value(val: str) -> Any:
-    val = val.strip().strip(",").strip("\"").strip("'")
+    val = val.strip(_VALUE_STRIP_CHARS)
 
     if not val:
         return ""
@@ -48,29 +87,33 @@ def _clean_value(val: str) -> Any:
     if "$" in val:
         return val
 
-    if val.lower() == ".true.":
-        return True
-    if val.lower() == ".false.":
-        return False
+    first = val[0]
+    if first == ".":
+        lowered = val.lower()
+        if lowered == ".true.":
+            return True
+        if lowered == ".false.":
+            return False
 
-    try:
+    # Only tokens starting with a sign, digit or dot can be numeric
+    if first not in _NUMERIC_START:
+        # NaN and Inf are invalid for simulation parameters
+        return None if val.lower() in _NONFINITE_TOKENS else val
+
+    if _INT_RE.fullmatch(val):
         return int(val)
-    except ValueError:
-        pass
 
-    try:
+    if _FORTRAN_FLOAT_RE.fullmatch(val):
         result = float(val.replace("d", "e").replace("D", "E"))
         # Filter out NaN and Inf values as they are invalid for simulation parameters
         if math.isnan(result) or math.isinf(result):
             return None
         return result
-    except ValueError:
-        return val
+    return None if val.lower() in _NONFINITE_TOKENS else val
 
 
 def _extract_key_values(line: str) -> Dict[str, Any]:
-    pattern = re.compile(r"([A-Za-z0-9_\-\(\)\./]+)\s*=\s*([-\d\.\*]+)")
-    matches = pattern.findall(line)
+    matches = _KV_RE.findall(line)
     return {k.strip(): _parse_value(v) for k, v in matches}
 
 
@@ -78,27 +121,31 @@ def _parse_value(val_str: str) -> Any:
     val_str = val_str.strip().strip(",")
     if "*******" in val_str:
         return None
-    try:
-        if "." in val_str:
-            return float(val_str)
-        return int(val_str)
-    except ValueError:
-        return val_str
+    if "." in val_str:
+        return float(val_str) if _FLOAT_RE.fullmatch(val_str) else val_str
+    return int(val_str) if _INT_RE.fullmatch(val_str) else val_str
 
 
-def _calc_stats(data_list: List[float]) -> Tuple[Optional[float], Optional[float]]:
-    if not data_list:
+def _calc_stats(data_list: Sequence[float]) -> Tuple[Optional[float], Optional[float]]:
+    # len() rather than truthiness so NumPy arrays are accepted too
+    if len(data_list) == 0:
         return None, None
     if len(data_list) == 1:
         return data_list[0], 0.0
+    if np is not None:
+        arr = np.asarray(data_list, dtype=np.float64)
+        return float(arr.mean()), float(arr.std(ddof=1))
     return statistics.mean(data_list), statistics.stdev(data_list)
 
 
 def _calc_volume(lengths: List[float], angles: List[float]) -> float:
     a, b, c = lengths
-    alpha, beta, gamma = [math.radians(x) for x in angles]
+    alpha, beta, gamma = angles
+    ca = math.cos(math.radians(alpha))
+    cb = math.cos(math.radians(beta))
+    cg = math.cos(math.radians(gamma))
 
-    term = 1 - math.cos(alpha) ** 2 - math.cos(beta) ** 2 - math.cos(gamma) ** 2 + 2 * math.cos(alpha) * math.cos(beta) * math.cos(gamma)
+    term = 1 - ca * ca - cb * cb - cg * cg + 2 * ca * cb * cg
     if term < 0:
         return 0.0
     return a * b * c * math.sqrt(term)
@@ -108,6 +155,7 @@ __all__ = [
     "HAS_NETCDF",
     "NETCDF_BACKEND",
     "MetadataBase",
+    "_DATACLASS_SLOTS",
     "_calc_stats",
     "_calc_volume",
     "_clean_value",
@@ -1,3 +1,8 @@
+import math
+import os
+
+import pytest
+
 from ambermeta.parsers import (
     InpcrdParser,
     MdcrdParser,
@@ -41,3 +46,118 @@ def test_mdcrd_parser(sample_md_data_dir):
     result = MdcrdParser(str(trajectory_file)).parse()
     assert result.filename == str(trajectory_file)
     assert result.details is not None
+
+
+def test_numeric_token_classification():
+    from ambermeta.legacy_extractors.mdin import _clean_value
+    from ambermeta.legacy_extractors.mdout import _parse_value
+    from ambermeta.utils import _clean_value as _clean_util_value
+
+    assert _clean_value("5,") == 5 and isinstance(_clean_value("5"), int)
+    assert _clean_value("1.0d-3") == 1.0e-3
+    assert _clean_value(".TRUE.") is True
+    assert _clean_value("'NONE'") == "NONE"
+    assert _clean_value("${TEMP}") == "${TEMP}"
+    assert math.isnan(_clean_value("NaN")) and _clean_value("-inf") == float("-inf")
+    assert _clean_util_value("nan") is None and _clean_util_value("+Infinity") is None
+    assert _clean_util_value("info") == "info"
+    assert _parse_value("0.004") == 0.004
+    assert _parse_value("-12") == -12
+    assert _parse_value("1.2.3") == "1.2.3"
+    assert _parse_value("*******") is None
+
+
+def test_mdcrd_cli_index_round_trip(sample_md_data_dir, tmp_path, monkeypatch, capsys):
+    from ambermeta.legacy_extractors import mdcrd
+
+    trajectory_file = str(sample_md_data_dir / "CH3L1_HUMAN_6NAG.crd")
+    index_path = str(tmp_path / "index.json")
+
+    mdcrd.main([trajectory_file, "--index", index_path])
+    first = capsys.readouterr().out
+    assert os.path.abspath(trajectory_file) in mdcrd.load_index(index_path)
+
+    def _fail(*_args):
+        raise AssertionError("indexed file was parsed again")
+
+    monkeypatch.setattr(mdcrd, "parse_mdcrd", _fail)
+    mdcrd.main([trajectory_file, "--index", index_path])
+    assert capsys.readouterr().out == first
+
+
+def _write_time_only_trajectory(path, times):
+    netcdf = pytest.importorskip("scipy.io").netcdf_file
+    with netcdf(str(path), "w") as ds:
+        ds.Conventions = "AMBER"
+        ds.createDimension("frame", None)
+        ds.createDimension("atom", 1)
+        var = ds.createVariable("time", times.dtype.char, ("frame",))
+        var[:] = times
+
+
+def test_mdcrd_flags_single_irregular_step(tmp_path):
+    np = pytest.importorskip("numpy")
+    from ambermeta.legacy_extractors import mdcrd
+
+    times = np.arange(3000, dtype=np.float64) * 2.0
+    times[1500:] += 0.5  # one restart jump in an otherwise uniform run
+    path = tmp_path / "jump.nc"
+    _write_time_only_trajectory(path, times)
+
+    md = mdcrd.parse_mdcrd(str(path))
+    assert md.n_frames == 3000
+    assert "Variable timestep detected within file." in md.warnings
+
+
+def test_mdcrd_timestep_check_allows_storage_rounding(tmp_path):
+    np = pytest.importorskip("numpy")
+    from ambermeta.legacy_extractors import mdcrd
+
+    # float32 storage near t=1e6 ps rounds each time to a 0.0625 ps grid, so a
+    # uniform 2.002 ps step wobbles by one ulp; that is not a variable timestep
+    base = 1.0e6 + np.arange(5000) * 2.002
+    path = tmp_path / "uniform.nc"
+    _write_time_only_trajectory(path, base.astype(np.float32))
+    assert mdcrd.parse_mdcrd(str(path)).warnings == []
+
+    # One real irregular step at the same magnitude still warns
+    jumped = base.copy()
+    jumped[2500:] += 0.5
+    path = tmp_path / "jumped.nc"
+    _write_time_only_trajectory(path, jumped.astype(np.float32))
+    assert "Variable timestep detected within file." in mdcrd.parse_mdcrd(str(path)).warnings
+
+
+def test_mdcrd_cli_jobs_matches_serial_output(sample_md_data_dir, tmp_path, capsys):
+    np = pytest.importorskip("numpy")
+    from ambermeta.legacy_extractors import mdcrd
+
+    inputs = [str(sample_md_data_dir / "CH3L1_HUMAN_6NAG.crd")]
+    for i in range(5):
+        path = tmp_path / f"seg_{i}.nc"
+        _write_time_only_trajectory(path, (i * 100.0 + np.arange(50) * 2.0))
+        inputs.append(str(path))
+
+    mdcrd.main(inputs + ["--jobs", "1"])
+    serial = capsys.readouterr().out
+    mdcrd.main(inputs + ["--jobs", "2"])
+    assert capsys.readouterr().out == serial
+    assert "seg_4.nc" in serial
+
+
+def test_mdcrd_volume_stats_across_frame_chunks(monkeypatch):
+    np = pytest.importorskip("numpy")
+    from ambermeta.legacy_extractors import mdcrd
+
+    rng = np.random.default_rng(0)
+    lengths = rng.uniform(40.0, 60.0, size=(50, 3)).astype(np.float32)
+    angles = rng.uniform(80.0, 110.0, size=(50, 3)).astype(np.float32)
+    monkeypatch.setattr(mdcrd, "_FRAME_CHUNK", 7)  # 50 frames -> 8 uneven chunks
+
+    for ang in (None, angles):
+        full = mdcrd._calc_volume_array(lengths, ang).copy()
+        vmin, vmax, vavg = mdcrd._volume_stats(lengths, ang)
+        assert vmin == full.min() and vmax == full.max()
+        assert vavg == pytest.approx(full.mean(), rel=1e-12)
+
+    assert mdcrd._volume_stats(lengths[:0], None) is None
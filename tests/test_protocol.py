@@ -86,6 +86,23 @@ def test_auto_discover_validates_each_stage_once(tmp_path, monkeypatch):
     assert validation.count(expected) == 1
 
 
+def test_protocol_builder_validates_each_stage_once(tmp_path, monkeypatch):
+    stage_dir = tmp_path / "protocol"
+    stage_dir.mkdir()
+
+    for ext in ("prmtop", "inpcrd", "mdin"):
+        (stage_dir / f"stage1.{ext}").write_text("")
+
+    monkeypatch.setattr(protocol, "PrmtopParser", _make_parser({"n_atoms": 10}))
+    monkeypatch.setattr(protocol, "InpcrdParser", _make_parser({"n_atoms": 12}))
+    monkeypatch.setattr(protocol, "MdinParser", _make_parser({"length_steps": 100}))
+
+    proto = protocol.ProtocolBuilder().from_directory(str(stage_dir)).build()
+
+    validation = proto.stages[0].validation
+    assert validation.count("Atom count mismatch across ['prmtop', 'inpcrd']: [10, 12]") == 1
+
+
 def test_manifest_bypasses_inference_and_preserves_order(tmp_path, monkeypatch):
     stage_dir = tmp_path / "protocol"
     stage_dir.mkdir()
@@ -278,6 +295,18 @@ def test_load_protocol_from_manifest_uses_parent_directory(tmp_path, monkeypatch
     assert proto.stages[0].mdin.filename == str(stage_dir / "alpha.mdin")
 
 
+def test_load_manifest_cache_tracks_edits_and_returns_fresh_copies(tmp_path):
+    manifest_path = tmp_path / "protocol.json"
+    manifest_path.write_text(json.dumps([{"name": "alpha", "mdin": "alpha.mdin"}]))
+
+    first = protocol.load_manifest(manifest_path, expand_env=False)
+    first[0]["name"] = "mutated"
+    assert protocol.load_manifest(manifest_path, expand_env=False)[0]["name"] == "alpha"
+
+    manifest_path.write_text(json.dumps([{"name": "beta", "mdin": "beta.mdin"}, {"name": "gamma"}]))
+    assert [entry["name"] for entry in protocol.load_manifest(manifest_path)] == ["beta", "gamma"]
+
+
 def test_gap_expectations_are_reported(tmp_path, monkeypatch):
     stage_dir = tmp_path / "protocol"
     stage_dir.mkdir()
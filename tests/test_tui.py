@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("textual")
+
+from textual.widgets import DataTable, Input, RadioButton, RadioSet, Select, Static
+
+from ambermeta import tui
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def _table_names(app):
+    table = app._stage_list.query_one(DataTable)
+    return [table.get_row_at(i)[0] for i in range(table.row_count)]
+
+
+def test_refresh_stages_coalesces_requests(sample_md_data_dir):
+    async def scenario():
+        app = tui.AmberMetaTUI(str(sample_md_data_dir))
+        async with app.run_test() as pilot:
+            for name in ("min", "heat", "prod"):
+                app.state.add_stage(tui.Stage(name=name))
+
+            calls = []
+            original = app._stage_list.refresh_stages
+
+            def counting_refresh():
+                calls.append(None)
+                original()
+
+            app._stage_list.refresh_stages = counting_refresh
+            app.refresh_stages()
+            app.refresh_stages()
+            app.refresh_stages()
+            await pilot.pause()
+            assert len(calls) == 1
+            assert _table_names(app) == ["min", "heat", "prod"]
+
+    _run(scenario())
+
+
+def test_stage_list_refresh_after_move_and_delete(sample_md_data_dir):
+    async def scenario():
+        app = tui.AmberMetaTUI(str(sample_md_data_dir))
+        async with app.run_test() as pilot:
+            for name, role in (("min", ""), ("heat", ""), ("prod", "production")):
+                app.state.add_stage(tui.Stage(name=name, role=role))
+            app.refresh_stages()
+            await pilot.pause()
+
+            app.current_stage_index = 0
+            app.action_move_down()
+            await pilot.pause()
+            assert _table_names(app) == ["heat", "min", "prod"]
+
+            app.action_delete_stage()  # "min", now at index 1
+            await pilot.pause()
+            assert _table_names(app) == ["heat", "prod"]
+
+            app.current_stage_index = 1
+            app.action_move_up()
+            await pilot.pause()
+            table = app._stage_list.query_one(DataTable)
+            assert [table.get_row_at(i)[:2] for i in range(table.row_count)] == [
+                ["prod", "production"],
+                ["heat", "-"],
+            ]
+
+            app.state.add_stage(tui.Stage(name="analysis"))
+            app.refresh_stages()
+            await pilot.pause()
+            assert _table_names(app) == ["prod", "heat", "analysis"]
+
+    _run(scenario())
+
+
+def test_export_modal_reopens_with_default_inputs(sample_md_data_dir):
+    async def scenario():
+        app = tui.AmberMetaTUI(str(sample_md_data_dir))
+        async with app.run_test() as pilot:
+            app.state.add_stage(tui.Stage(name="prod"))
+
+            app.action_export()
+            await pilot.pause()
+            modal = app.screen
+            assert isinstance(modal, tui.ExportModal)
+            modal.query_one("#export-format", Select).value = "json"
+            modal.query_one("#export-filename", Input).value = "custom.json"
+            modal.query_one("#rel-paths", RadioButton).value = True
+            await pilot.pause()
+            assert modal.query_one("#path-type", RadioSet).pressed_index == 1
+            await pilot.press("escape")
+            await pilot.pause()
+
+            app.action_export()
+            await pilot.pause()
+            assert app.screen is modal  # the installed instance is reused
+            assert modal.query_one("#export-format", Select).value == "yaml"
+            assert modal.query_one("#export-filename", Input).value == "manifest.yaml"
+            assert modal.query_one("#path-type", RadioSet).pressed_index == 0
+            assert not modal.query_one("#rel-paths", RadioButton).value
+
+    _run(scenario())
+
+
+def test_search_modal_reopens_with_cleared_filters(sample_md_data_dir):
+    async def scenario():
+        app = tui.AmberMetaTUI(str(sample_md_data_dir))
+        async with app.run_test() as pilot:
+            app.action_search()
+            await pilot.pause()
+            modal = app.screen
+            total = len(modal.results)
+            assert total > 0
+            modal.query_one("#search-input", Input).value = "ntp_prod_0001"
+            modal.query_one("#type-filter", Select).value = "mdin"
+            await pilot.pause()
+            assert len(modal.results) == 1
+            await pilot.press("escape")
+            await pilot.pause()
+
+            app.action_search()
+            await pilot.pause()
+            assert app.screen is modal
+            assert modal.query_one("#search-input", Input).value == ""
+            assert modal.query_one("#type-filter", Select).value == "all"
+            assert len(modal.results) == total
+
+    _run(scenario())
+
+
+def test_auto_generate_bulk_select_updates_stats_once(sample_md_data_dir):
+    async def scenario():
+        app = tui.AmberMetaTUI(str(sample_md_data_dir))
+        async with app.run_test() as pilot:
+            app.action_auto_generate()
+            await pilot.pause()
+            modal = app.screen
+            assert isinstance(modal, tui.AutoGenerateModal)
+            total = len(modal._stem_info)
+            assert total > 1
+
+            calls = []
+            original = modal._update_stats
+
+            def counting_update():
+                calls.append(None)
+                original()
+
+            modal._update_stats = counting_update
+            modal.action_select_all()
+            await pilot.pause()
+            assert len(calls) == 1  # no per-checkbox change events
+            assert len(modal.selected_stems) == total
+            assert all(cb.value for cb in modal.query("#stem-list RadioButton"))
+            count = modal.query_one("#selection-count", Static).renderable
+            assert str(count) == f"Selected: {total}/{total} groups"
+
+            modal.action_select_none()
+            await pilot.pause()
+            assert len(calls) == 2
+            assert modal.selected_stems == set()
+            assert not any(cb.value for cb in modal.query("#stem-list RadioButton"))
+
+    _run(scenario())
+
+
+def test_search_modal_snapshots_discovered_files_per_opening(tmp_path):
+    (tmp_path / "prod_a.mdin").write_text("&cntrl\n  nstlim=10,\n/\n")
+
+    async def scenario():
+        app = tui.AmberMetaTUI(str(tmp_path))
+        async with app.run_test() as pilot:
+            app.action_search()
+            await pilot.pause()
+            modal = app.screen
+            assert len(modal.results) == 1
+
+            (tmp_path / "prod_b.mdin").write_text("&cntrl\n  nstlim=10,\n/\n")
+            app.state.discover_files(recursive=True)
+            modal.query_one("#search-input", Input).value = "prod"
+            await pilot.pause()
+            assert len(modal.results) == 1  # filtering reuses this opening's snapshot
+            await pilot.press("escape")
+            await pilot.pause()
+
+            app.action_search()
+            await pilot.pause()
+            assert len(modal.results) == 2
+
+    _run(scenario())